@@ -4,6 +4,7 @@ from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
+import asyncio
 import json
 import io
 import os
@@ -27,22 +28,32 @@ try:
 except ImportError:
     genai = None
 
-from zyntalic.translator import translate_text, warm_translation_pipeline
+from zyntalic.models import memory_report
+from zyntalic.translator import split_sentences, translate_text, warm_translation_pipeline
 from zyntalic.utils.cache import (
     get_cached_translation,
-    put_cached_translation,
+    get_cached_translations,
+    put_cached_translations,
     init_cache,
 )
 
 app = FastAPI(title="Zyntalic API", version="0.3.0")
 
 
+def _startup_engines() -> list[str]:
+    """Engines to warm at startup: ZYNTALIC_WARM_ENGINES (comma-separated), else
+    ZYNTALIC_DEFAULT_ENGINE, else core. Others are built on first use."""
+    names = os.environ.get("ZYNTALIC_WARM_ENGINES") or os.environ.get("ZYNTALIC_DEFAULT_ENGINE") or "core"
+    return [n.strip() for n in names.split(",") if n.strip()]
+
+
 @app.on_event("startup")
 async def startup_event():
     # Warm up cache on startup
     init_cache()
     try:
-        warm_translation_pipeline()
+        # off the event loop: loading resources is blocking work
+        await asyncio.to_thread(warm_translation_pipeline, engines=_startup_engines())
     except Exception as exc:
         print(f"[startup] Translation warmup skipped: {exc}")
 
@@ -77,7 +88,7 @@ def _find_frontend_file(filename: str) -> Path | None:
 class TranslateRequest(BaseModel):
     text: str
     mirror_rate: float = 0.3  # Lower value = more Zyntalic vocabulary, higher = more English templates
-    engine: str = "core"  # "core"|"chiasmus"|"transformer"|"test_suite"
+    engine: str = "core"  # "core"|"chiasmus"|"transformer"|"test_suite"|"lexical"
 
 
 class GeminiTranslateRequest(BaseModel):
@@ -282,34 +293,39 @@ else:
 def health():
     return {"ok": True}
 
+
+@app.get("/health/models")
+def health_models():
+    """Embedding model held by this worker (shared by all engines) and its memory use."""
+    return memory_report()
+
 @app.post("/translate")
 def translate(req: TranslateRequest):
     try:
         print(f"[TRANSLATE] Request received: text='{req.text[:50]}...', engine={req.engine}, mirror_rate={req.mirror_rate}")
         
-        # First try cache to avoid re-generation
+        # First try cache to avoid re-generation: the whole text, then every sentence
         cached = get_cached_translation(req.text, req.engine, req.mirror_rate)
         if cached:
             print(f"[TRANSLATE] Cache hit, returning cached result")
             return {"rows": [cached], "cached": True}
+        sentences = split_sentences(req.text)
+        cached_rows = get_cached_translations(sentences, req.engine, req.mirror_rate)
+        if sentences and all(cached_rows):
+            print(f"[TRANSLATE] Cache hit for all {len(sentences)} sentences")
+            return {"rows": cached_rows, "cached": True}
 
         print(f"[TRANSLATE] Cache miss, generating new translation...")
         rows = translate_text(req.text, mirror_rate=req.mirror_rate, engine=req.engine)
         print(f"[TRANSLATE] Generated {len(rows)} translation rows")
 
-        stored_rows = []
         for i, row in enumerate(rows):
             print(f"[TRANSLATE] Row {i}: source='{row.get('source', 'N/A')[:30]}...', target='{row.get('target', 'N/A')[:30]}...'")
-            stored_rows.append(
-                put_cached_translation(
-                    source=row.get("source", req.text),
-                    target=row.get("target", ""),
-                    engine=row.get("engine", req.engine),
-                    mirror_rate=req.mirror_rate,
-                    anchors=row.get("anchors", []),
-                    embedding=row.get("embedding") if isinstance(row, dict) else None,
-                )
-            )
+        stored_rows = put_cached_translations(
+            [dict(row, source=row.get("source", req.text)) for row in rows],
+            mirror_rate=req.mirror_rate,
+            engine=req.engine,
+        )
 
         print(f"[TRANSLATE] Success: returning {len(stored_rows)} rows")
         return {"rows": stored_rows, "cached": False}
@@ -0,0 +1,57 @@
+import random
+from collections import Counter
+
+from zyntalic import chiasmus, core, translator
+
+
+def _scan_vote(words, lexicons):
+    votes = Counter()
+    for w in words:
+        w = w.lower()
+        if w in chiasmus.IGNORED_WORDS:
+            continue
+        for anchor, data in lexicons.items():
+            if w in data.get("nouns", []) or w in data.get("verbs", []):
+                votes[anchor] += 1
+    return votes.most_common(1)[0][0] if votes else "Neutral"
+
+
+def test_word_index_votes_like_lexicon_scan():
+    lexicons = core.load_lexicons()
+    vocab = sorted({w for data in lexicons.values() for w in data.get("nouns", []) + data.get("verbs", [])})
+    rng = random.Random(1)
+    for _ in range(200):
+        words = [rng.choice(vocab + ["zzz", "The"]) for _ in range(rng.randint(0, 8))]
+        assert chiasmus.analyze_context_vector(words) == _scan_vote(words, lexicons)
+
+
+def test_chiasmus_engine_no_longer_falls_back_to_core():
+    row = translator.translate_sentence("The war brings death, and death brings war.", engine="chiasmus")
+    assert row["engine"] == "chiasmus"
+    assert row["target"].split()[0] == chiasmus.generate_latin_word("The")
+
+
+def test_chiasmus_pipeline_is_deterministic_and_quiet(capsys):
+    text = "The war brings death, and death brings war. The priest blessed the knife. 123."
+    first = chiasmus.translate_saramago_chiasmus(text)
+    chiasmus.clear_chiasmus_memo()
+    assert chiasmus.translate_saramago_chiasmus(text) == first
+    assert chiasmus.translate_chiasmus(text) == first
+    assert capsys.readouterr().out == ""
+
+    batch = ["Love is the law.", "The king became a beggar.", "Love is the law."]
+    assert chiasmus.translate_chiasmus_batch(batch) == [chiasmus.translate_chiasmus(t) for t in batch]
+    assert chiasmus.generate_latin_word("River") == chiasmus._generate_latin_word("River")
+
+
+def test_sentence_memo_follows_lexicon_reload(monkeypatch):
+    sent = "The war brings death, and death brings war."
+    anchors = list(core.load_lexicons())
+    swapped = {anchors[0]: {"nouns": ["war"]}, anchors[1]: {"nouns": ["death"]}}
+    chiasmus.chiasmus_sentence(sent)
+
+    monkeypatch.setattr(core, "load_lexicons", lambda: swapped)
+    reloaded = chiasmus.chiasmus_sentence(sent)
+    assert reloaded == chiasmus._chiasmus_sentence(sent)
+    monkeypatch.setattr(core, "load_lexicons", lambda: {})
+    assert chiasmus.chiasmus_sentence(sent) != reloaded
@@ -0,0 +1,287 @@
+import math
+
+import pytest
+
+from zyntalic import core
+from zyntalic.utils.registry import ResourceRegistry
+
+
+def _reference_anchor_weights(vec, top_k=3):
+    v = core._normalize(vec)
+    scores = [(a, core._dot(v, core._normalize(av))) for a, av in core._get_anchor_vecs().items()]
+    scores.sort(key=lambda x: x[1], reverse=True)
+    top = scores[:top_k]
+    m = max(s for _, s in top)
+    exps = [math.exp(s - m) for _, s in top]
+    return [(name, e / sum(exps)) for (name, _), e in zip(top, exps)]
+
+
+def test_anchor_weights_match_full_scan():
+    for i in range(50):
+        vec = core.base_embedding(f"probe:{i}")
+        for k in (1, 3, 5):
+            assert core.anchor_weights_for_vec(vec, top_k=k) == _reference_anchor_weights(vec, k)
+
+
+def test_generate_entries_matches_generate_entry():
+    seeds = [f"batch:{i}" for i in range(40)]
+    assert core.generate_entries(seeds, mirror_rate=0.5) == [
+        core.generate_entry(s, mirror_rate=0.5) for s in seeds
+    ]
+
+
+def test_sampling_table_draws_match_linear_scan():
+    anchors = ["Homer_Iliad", "Plato_Republic", "Laozi_TaoTeChing"]
+    base = ["journey", "whisper", "echo"]
+    for i in range(30):
+        weights = [0.5 + i / 100, 0.3, 0.2 - i / 200]
+        pool, wts = core._mix_lists(anchors, weights, "nouns", base)
+        table = core._sampling_table(anchors, weights, "nouns", base)
+        rng_a, rng_b = core.get_rng(f"draw:{i}"), core.get_rng(f"draw:{i}")
+        for _ in range(20):
+            assert table.sample(rng_a) == core._weighted_sample(rng_b, pool, wts)
+
+
+def test_generate_word_is_stable():
+    # pinned outputs; any change in RNG consumption shows up here
+    assert core.generate_word("w0") == "뇯ząsog"
+    assert core.generate_word("w1") == "츗fifę"
+    assert core.generate_word("w2") == "뛠jyśćneł"
+    assert core.make_korean_tail("w0") == "범뀢"
+    assert core.compose_hangul_block("ᄒ", "ᅵ", "ᇂ") == "힣"
+
+
+def test_entry_memo_is_keyed_by_projection():
+    np = pytest.importorskip("numpy")
+    core.clear_memo()
+    plain = core.generate_entry("memo-probe")
+    assert core.generate_entry("memo-probe") == plain
+    assert core.memo_stats()["entry"]["hits"] == 1
+
+    W = np.eye(300)
+    projected = core.generate_entry("memo-probe", W=W)
+    assert projected["embedding"] != plain["embedding"]
+    assert core.generate_entry("memo-probe", W=W.copy()) == projected
+    assert core.memo_stats()["entry"]["hits"] == 2
+
+
+def test_pseudo_embedding_v2_is_opt_in_and_recorded():
+    from zyntalic import embeddings
+
+    if embeddings.embedding_backend() != "pseudo-v1":
+        pytest.skip("a real embedding model is loaded; pseudo versions don't apply")
+    v1 = core.generate_entry("version-probe")
+    assert v1["embedding_backend"] == "pseudo-v1"
+    try:
+        embeddings.set_pseudo_embedding_version("v2")
+        v2 = core.generate_entry("version-probe")
+        assert v2["embedding_backend"] == "pseudo-v2"
+        assert embeddings.embed_text("x", dim=16) == embeddings.embed_text("x", dim=16)
+        assert v2["embedding"] != v1["embedding"]
+    finally:
+        embeddings.set_pseudo_embedding_version("v1")
+    assert core.generate_entry("version-probe") == v1
+
+
+def test_parallel_generate_words_matches_serial():
+    serial = core.generate_words(n=40, use_projection=False, root_seed="par")
+    parallel = core.generate_words(n=40, use_projection=False, root_seed="par", workers=2, block_size=7)
+    assert parallel == serial
+
+
+def test_parallel_generate_words_matches_serial_with_projection(monkeypatch):
+    np = pytest.importorskip("numpy")
+    W = np.random.default_rng(7).standard_normal((300, 300))
+    monkeypatch.setattr(core, "load_projection", lambda path="models/W.npy": W)
+
+    serial = core.generate_words(n=300, root_seed="proj")
+    parallel = core.generate_words(n=300, root_seed="proj", workers=2, block_size=64)
+    assert parallel == serial
+    # a row does not depend on the batch it was projected in
+    single = core.generate_entries(["proj:5"], W=W)[0]
+    assert core.generate_entries([f"proj:{j}" for j in range(64)], W=W)[5] == single
+
+
+def test_columnar_export_round_trip(tmp_path):
+    pytest.importorskip("numpy")
+    entries = core.generate_entries([f"col:{i}" for i in range(25)])
+    core.export_to_columnar(entries, tmp_path / "lex", chunk_size=10)
+    lex = core.load_columnar(tmp_path / "lex")
+
+    assert lex["word"] == [e["word"] for e in entries]
+    assert lex["sentence"] == [e["sentence"] for e in entries]
+    assert lex["embeddings"].shape == (25, 300)
+    assert core.np.allclose(lex["embeddings"][3], entries[3]["embedding"], atol=1e-6)
+    names = [lex["anchor_names"][i] for i in lex["anchor_ids"][3]]
+    assert names == [a for a, _ in entries[3]["anchors"]]
+
+    bare = entries[:2] + [core.generate_entry("col:bare", with_embedding=False)]
+    with pytest.raises(ValueError, match="entry 2"):
+        core.export_to_columnar(bare, tmp_path / "bare")
+    assert not (tmp_path / "bare").exists()
+
+
+def test_resource_snapshot_freshness(tmp_path):
+    import json
+    import os
+
+    from zyntalic.utils.snapshot import read_section
+
+    lex_dir = tmp_path / "lexicon"
+    lex_dir.mkdir()
+    src = lex_dir / "Anchor.json"
+    src.write_text(json.dumps({"nouns": ["river"]}), encoding="utf-8")
+    snap = str(tmp_path / "snap.pkl")
+    core.build_resource_snapshot(snap, lexicon_dir=str(lex_dir))
+
+    def section():
+        return read_section("lexicons", os.path.abspath(lex_dir), [str(src)], path=snap)
+
+    assert section() == {"Anchor": {"nouns": ["river"]}}
+    os.utime(src, ns=(0, 0))  # mtime changed, content identical -> still fresh
+    assert section() == {"Anchor": {"nouns": ["river"]}}
+    src.write_text(json.dumps({"nouns": ["sea"]}), encoding="utf-8")
+    assert section() is None
+
+
+def test_clear_resource_cache_drops_outputs_built_from_lexicons(tmp_path, monkeypatch):
+    import json
+
+    monkeypatch.setenv("ZYNTALIC_SNAPSHOT", "")
+    lex_dir = tmp_path / "lexicon"
+    lex_dir.mkdir()
+
+    def write_lexicons(tag):
+        for name in core.ANCHORS:
+            data = {f: [f"{tag}{f}{i}" for i in range(5)] for f in ("nouns", "verbs", "adjectives")}
+            (lex_dir / f"{name}.json").write_text(json.dumps(data), encoding="utf-8")
+
+    write_lexicons("old")
+    monkeypatch.chdir(tmp_path)
+    core.clear_resource_cache("lexicons")
+    try:
+        before = core.generate_entry("Love", mirror_rate=0.0)["meaning"]
+        write_lexicons("new")
+        core.clear_resource_cache("lexicons")
+        after = core.generate_entry("Love", mirror_rate=0.0)["meaning"]
+        assert after != before
+    finally:
+        monkeypatch.undo()
+        core.clear_resource_cache("lexicons")
+
+
+def test_resource_registry_builds_once_per_key():
+    import threading
+    import time
+
+    registry = ResourceRegistry()
+    calls = []
+
+    def slow_factory():
+        calls.append(1)
+        time.sleep(0.05)
+        return object()
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(registry.get(("thing", 1), slow_factory)))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+
+    assert len(next(iter(core._get_anchor_vecs(16).values()))) == 16
+    assert len(next(iter(core._get_anchor_vecs(300).values()))) == 300
+
+
+def test_embedding_arrays_and_float32_mode():
+    pytest.importorskip("numpy")
+    as_list = core.generate_entry("dtype-probe")
+    as_array = core.generate_entry("dtype-probe", as_array=True)
+    assert isinstance(as_list["embedding"], list)
+    assert as_array["embedding"].tolist() == as_list["embedding"]
+    assert not as_array["embedding"].flags.writeable
+    batch = core.generate_entries(["dtype-probe"], as_array=True)[0]
+    assert batch["embedding"].tolist() == as_list["embedding"]
+
+    try:
+        core.set_embedding_dtype("float32")
+        f32 = core.generate_entry("dtype-probe", as_array=True)
+        assert f32["embedding"].dtype == core.np.float32
+        assert core.np.allclose(f32["embedding"], as_array["embedding"], atol=1e-6)
+        assert [a for a, _ in f32["anchors"]] == [a for a, _ in as_list["anchors"]]
+        V = as_array["embedding"].reshape(1, -1)
+        exact = core._top_anchor_scores_many(core._normalize_rows(V), 5)[0]
+        fast = core._top_anchor_scores_many(core._normalize_rows(V.astype(core.np.float32)), 5)[0]
+        assert [a for a, _ in fast] == [a for a, _ in exact]
+        assert core.np.allclose([s for _, s in fast], [s for _, s in exact], atol=1e-5)
+    finally:
+        core.set_embedding_dtype("float64")
+    assert core.generate_entry("dtype-probe") == as_list
+
+
+def test_entry_without_embedding_matches_full_entry():
+    core.clear_memo()
+    lazy = core.generate_entry("lazy-probe", with_embedding=False)
+    assert lazy["embedding"] is None
+    assert core.memo_stats()["anchors"]["misses"] == 1
+    # other mirror rates reuse the memoized anchor weights
+    core.generate_entry("lazy-probe", mirror_rate=0.8, with_embedding=False)
+    assert core.memo_stats()["anchors"]["hits"] == 1
+
+    full = core.generate_entry("lazy-probe")
+    assert full["embedding"] is not None
+    assert dict(full, embedding=None) == lazy
+    core.clear_memo()
+    assert core.generate_entry("lazy-probe") == full
+
+
+def test_sentence_vocab_prefers_mappings_then_generated_words():
+    mappings = core.load_vocabulary_mappings()
+    vocab = core._sentence_vocab()
+    for field in ("adjectives", "nouns", "verbs"):
+        for en, zy in list(mappings.get(field, {}).items())[:5]:
+            assert core._sentence_word(vocab[field], field, en) == zy
+    unmapped = "zzz-not-a-mapped-noun"
+    assert core._sentence_word(vocab["nouns"], "noun", unmapped) == core.generate_word(f"noun::{unmapped}")
+    assert vocab["nouns"][unmapped] == core.generate_word(f"noun::{unmapped}")
+
+
+def test_phrase_matcher_finds_leftmost_longest_spans():
+    import random
+
+    from zyntalic.utils.phrase_matcher import PhraseMatcher
+
+    def reference(phrases, tokens):
+        spans, i = [], 0
+        while i < len(tokens):
+            n = max((len(p) for p in phrases if tuple(tokens[i:i + len(p)]) == p), default=0)
+            spans.append((i, i + n)) if n else None
+            i += n or 1
+        return spans
+
+    rng = random.Random(0)
+    vocab = ["a", "b", "c", "d"]
+    phrases = {tuple(rng.choice(vocab) for _ in range(rng.randint(1, 4))) for _ in range(12)}
+    matcher = PhraseMatcher(" ".join(p) for p in phrases)
+    for _ in range(200):
+        tokens = [rng.choice(vocab) for _ in range(rng.randint(0, 20))]
+        assert matcher.find(tokens) == reference(phrases, tokens)
+
+    m = PhraseMatcher(["ice cream", "ice", "cream cheese"])
+    assert m.segment("Ice cream cheese and ice".split()) == [
+        (("Ice", "cream"), True), (("cheese",), False), (("and",), False), (("ice",), True),
+    ]
+
+
+def test_memoized_entries_are_not_shared_with_callers():
+    first = core.generate_entry("alias-check", with_embedding=False)
+    expected = list(first["anchors"])
+    first["anchors"].append(("junk", 1.0))
+    core.anchor_weights_for_seed("alias-check").clear()
+    assert core.generate_entry("alias-check", with_embedding=False)["anchors"] == expected
+    assert core.anchor_weights_for_seed("alias-check") == expected
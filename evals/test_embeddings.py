@@ -0,0 +1,82 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from zyntalic import embeddings, models, transformers  # noqa: E402
+from zyntalic.models import StubModel  # noqa: E402
+from zyntalic.utils import cache  # noqa: E402
+from zyntalic.utils.embedding_store import EmbeddingStore  # noqa: E402
+
+
+@pytest.fixture
+def stub():
+    model = StubModel(dim=16)
+    models.set_model(model, "stub/model")
+    yield model
+    models.set_model(None)
+
+
+def test_embed_texts_matches_embed_text_without_store():
+    texts = ["alpha", "", "beta", "alpha"]
+    assert embeddings.embed_texts(texts, dim=32) == [embeddings.embed_text(t, dim=32) for t in texts]
+
+
+def test_store_round_trip_across_instances(tmp_path):
+    store = EmbeddingStore(str(tmp_path), "pseudo-v2", 8)
+    vecs = np.arange(24, dtype=np.float32).reshape(3, 8)
+    store.put_many(["a", "b", "a"], vecs)
+    assert len(store) == 2
+
+    reopened = EmbeddingStore(str(tmp_path), "pseudo-v2", 8)
+    a, missing, b = reopened.get_many(["a", "zzz", "b"])
+    assert missing is None
+    assert a.tolist() == vecs[0].tolist() and b.tolist() == vecs[1].tolist()
+
+
+def test_embed_texts_encodes_each_text_once(stub, tmp_path):
+    store = EmbeddingStore(str(tmp_path), embeddings.embedding_backend(), 12)
+    texts = ["one", "two", "one", "three"]
+    first = embeddings.embed_texts(texts, dim=12, store=store)
+    assert sorted(stub.encoded) == ["one", "three", "two"]
+    assert first[0] == first[2] and len(first[1]) == 12
+
+    stub.encoded.clear()
+    reopened = EmbeddingStore(str(tmp_path), embeddings.embedding_backend(), 12)
+    assert embeddings.embed_texts(texts + ["four"], dim=12, store=reopened)[:4] == first
+    assert stub.encoded == ["four"]
+
+    with pytest.raises(ValueError):
+        embeddings.embed_texts(texts, dim=16, store=store)
+
+
+def test_put_cached_translations_saves_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(cache, "CACHE_PATH", str(tmp_path / "translations.json"))
+    monkeypatch.setattr(cache, "_cache", {})
+    monkeypatch.setattr(cache, "_initialized", True)
+    saves = []
+    monkeypatch.setattr(cache, "save_cache", lambda: saves.append(1))
+
+    rows = [{"source": "Hello.", "target": "x"}, {"source": "Bye.", "target": "y", "embedding": [0.5]}]
+    stored = cache.put_cached_translations(rows, mirror_rate=0.8, engine="core")
+    assert len(saves) == 1
+    assert stored[0]["embedding"] == embeddings.embed_text("x", dim=300)
+    assert stored[1]["embedding"] == [0.5] and stored[1]["embedding_backend"] is None
+    hits = cache.get_cached_translations(["Hello.", "Nope.", "Bye."], "core", 0.8)
+    assert [h and h["target"] for h in hits] == ["x", None, "y"]
+
+
+def test_registry_model_is_shared(monkeypatch):
+    monkeypatch.setenv("ZYNTALIC_MODEL_BACKEND", "stub")
+    models.set_model(None)
+    try:
+        assert models.memory_report()["loaded"] is False  # reporting never loads
+        model = transformers.get_model()
+        assert isinstance(model, StubModel) and embeddings.embedding_backend() == "stub/all-MiniLM-L6-v2"
+        assert models.get_model() is model
+        embeddings.embed_text("shared", dim=8)
+        assert model.encoded == ["shared"]
+        report = models.memory_report()
+        assert report["loaded"] and report["model"] == "stub/all-MiniLM-L6-v2"
+    finally:
+        models.set_model(None)
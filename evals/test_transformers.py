@@ -0,0 +1,44 @@
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from zyntalic import transformers, translator  # noqa: E402
+from zyntalic.models import StubModel  # noqa: E402
+
+
+@pytest.fixture
+def stub(tmp_path, monkeypatch):
+    monkeypatch.setenv("ZYNTALIC_ANCHOR_CACHE_DIR", str(tmp_path))
+    model = StubModel(dim=16)
+    transformers.set_model(model, "stub/model")
+    # core embeds its anchor vectors with the same shared model; count only what follows
+    transformers.get_anchor_embeddings()
+    model.calls = 0
+    yield model
+    transformers.set_model(None)
+
+
+def test_anchor_matrix_is_encoded_once_and_persisted(stub, tmp_path):
+    texts = ["The war is long.", "Love endures.", "A river at night."]
+    batch = transformers.semantic_match_many(texts)
+    assert stub.calls == 2  # anchors once, then every text in one call
+    assert batch == [transformers.semantic_match(t) for t in texts]
+    assert stub.calls == 5
+    assert os.path.exists(tmp_path / "stub_model.npz")
+
+    # a fresh process (empty in-memory cache) loads the anchors from disk
+    fresh = StubModel(dim=16)
+    transformers.set_model(fresh, "stub/model")
+    assert transformers.semantic_match_many(texts) == batch
+    assert fresh.calls == 1
+
+
+def test_transformer_engine_batches_translate_text(stub):
+    text = "The war is long. Love endures. A river at night. Love endures."
+    rows = translator.translate_text(text, engine="transformer")
+    assert [r["engine"] for r in rows] == ["transformer"] * 4
+    assert stub.calls == 2
+    parts = [p for p in translator._SENT_SPLIT.split(text) if p.strip()]
+    assert rows == [translator.translate_sentence(p, mirror_rate=0.8, engine="transformer") for p in parts]
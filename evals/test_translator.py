@@ -0,0 +1,143 @@
+import pytest
+
+from zyntalic import core, translator
+
+
+def test_lemma_table_answers_like_core(tmp_path, monkeypatch):
+    path = str(tmp_path / "lemma_table.pkl")
+    monkeypatch.setenv("ZYNTALIC_LEMMA_TABLE", path)
+    translator.build_lemma_table(mirror_rates=[0.3], lemmas=["love", "war"])
+    assert translator._lookup_lemma_table("love", 0.3, translator._PROJECTION_W) is not None
+
+    row = translator.translate_sentence("Love endures.", mirror_rate=0.3)
+    entry = core.generate_entry("love", mirror_rate=0.3, W=translator._PROJECTION_W)
+    assert row["target"] == entry["sentence"]
+    assert row["anchors"] == entry["anchors"]
+
+    # other mirror rates and projections are not in the table
+    assert translator._lookup_lemma_table("love", 0.8, translator._PROJECTION_W) is None
+    if core.np is not None:
+        assert translator._lookup_lemma_table("love", 0.3, core.np.eye(300)) is None
+
+
+def test_translate_text_reuses_rows_per_lemma():
+    starts = ["The", "I", "And", "River", "the"]
+    text = " ".join(f"{starts[i % len(starts)]} walked {i} miles. " for i in range(40)) + " ?! ..."
+    parts = [p for p in translator._SENT_SPLIT.split(text.strip()) if p.strip()]
+    for engine in ("core", "transformer"):
+        expected = [translator.translate_sentence(p, mirror_rate=0.8, engine=engine) for p in parts]
+        assert translator.translate_text(text, engine=engine) == expected
+
+
+def test_parallel_translate_text_matches_serial(monkeypatch):
+    monkeypatch.setattr(translator, "_PARALLEL_MIN_SENTENCES", 1)
+    text = " ".join(f"Sentence{i % 37} number {i}." for i in range(120))
+    serial = translator.translate_text(text)
+    assert translator.translate_text(text, workers=2, chunk_size=8) == serial
+
+
+def test_translate_iter_matches_translate_text_across_chunks():
+    import io
+
+    text = "  The sky is wide.  And I saw it!\\n\\nDid you?  The end...  \\n"
+    text = text.replace("\\n", "\n") * 5
+    expected = translator.translate_text(text)
+    assert list(translator.translate_iter(io.StringIO(text), chunk_chars=3)) == expected
+    assert list(translator.translate_iter(io.BytesIO(text.encode("utf-8")), chunk_chars=5)) == expected
+    assert list(translator.translate_iter(io.StringIO(text).readlines())) == expected
+    assert list(translator.translate_iter("")) == []
+
+
+def test_engine_registry_builds_each_engine_once():
+    import threading
+
+    built = []
+
+    class Echo(translator.Engine):
+        name = "echo"
+
+        def __init__(self):
+            built.append(self)
+
+        def translate(self, src, lemma, *, mirror_rate, W=None):
+            return {"source": src, "target": src.upper(), "lemma": lemma, "anchors": [], "engine": "echo"}
+
+    def broken():
+        built.append(None)
+        raise RuntimeError("unavailable")
+
+    with pytest.raises(TypeError):
+        translator.Engine()  # translate is abstract
+    translator.register_engine("echo", Echo)
+    translator.register_engine("broken", broken)
+    try:
+        threads = [threading.Thread(target=translator.get_engine, args=("echo",)) for _ in range(8)]
+        for th in threads:
+            th.start()
+        for th in threads:
+            th.join()
+        assert translator.translate_sentence("hi there", engine="echo")["target"] == "HI THERE"
+        assert len(built) == 1
+
+        # a failed build is remembered and every call falls back to core
+        core_row = translator.translate_sentence("hi there")
+        assert translator.translate_sentence("hi there", engine="broken") == core_row
+        assert translator.translate_sentence("hi there", engine="broken") == core_row
+        assert len(built) == 2
+        assert translator.translate_sentence("hi there", engine="no-such-engine") == core_row
+    finally:
+        for name in ("echo", "broken"):
+            translator._ENGINE_FACTORIES.pop(name, None)
+            translator._ENGINES.clear(name)
+
+
+def test_lexical_engine_translates_every_token():
+    mappings = core.load_vocabulary_mappings()
+    row = translator.translate_sentence("The cat chased dogs in the garden.", engine="lexical")
+    assert row["engine"] == "lexical" and row["anchors"]
+
+    ps = core.to_zyntalic_order("The cat chased dogs in the garden.")
+    assert (ps.subject, ps.verb, ps.obj, ps.tense) == ("The cat", "chased", "dogs", "past")
+    expected = [
+        mappings["nouns"]["cat"],  # "The" has no Zyntalic counterpart
+        core.pluralize(core.lexical_token("dogs")),
+        core.mark_tense(core.lexical_token("chased", "verb"), "past"),
+        core.lexical_token("in"),
+        core.lexical_token("garden"),
+    ]
+    body, tail = row["target"].rsplit(" ", 1)
+    assert body == " ".join(expected) and tail.startswith("⟦ctx:han=")
+
+    # repeated vocabulary is served from the token memo
+    core.clear_memo()
+    translator.translate_text("The cat chased dogs. The cat chased dogs again.", engine="lexical")
+    stats = core.memo_stats()["tokens"]
+    assert stats["size"] == 4 and stats["hits"] == 3
+
+
+def test_lexical_engine_keeps_multiword_expressions_together(monkeypatch):
+    from zyntalic.utils.phrase_matcher import PhraseMatcher
+
+    monkeypatch.setattr(core, "phrase_matcher", lambda: PhraseMatcher(["ice cream"]))
+    body, _ = core.lexical_sentence("Children want the ice cream.")
+    assert body.split()[1:] == [core.lexical_token("ice cream"), core.lexical_token("want", "verb")]
+    assert core.lexical_token("ice cream") == core.generate_word("noun::ice cream")
+
+
+def test_rows_do_not_share_anchor_lists():
+    rows = translator.translate_text("Hello world. Hello world.")
+    expected = list(rows[1]["anchors"])
+    rows[0]["anchors"].clear()
+    assert rows[1]["anchors"] == expected
+    assert translator.translate_text("Hello world.")[0]["anchors"] == expected
+    streamed = list(translator.translate_iter("Hello world. Hello world."))
+    streamed[0]["anchors"].clear()
+    assert streamed[1]["anchors"] == expected
+
+
+def test_engines_accept_an_array_projection():
+    np = pytest.importorskip("numpy")
+    W = np.random.default_rng(3).standard_normal((300, 300))
+    for engine in ("core", "lexical"):
+        row = translator.translate_sentence("The cat sleeps.", engine=engine, W=W)
+        assert row["engine"] == engine and row["anchors"]
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmark: chiasmus anchor voting via the word index vs the lexicon scan.
+
+Usage:
+    python scripts/bench_chiasmus.py [--n 5000] [--words 12] [--repeat 3]
+
+The legacy path below is the original ``analyze_context_vector`` (a ``list``
+membership test per word per anchor). Both paths vote over the same random
+sentences drawn from the lexicon vocabulary and must pick identical anchors.
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from zyntalic import chiasmus, core  # noqa: E402
+
+
+# --- legacy reference --------------------------------------------------------
+def legacy_analyze_context_vector(words, lexicons):
+    votes = Counter()
+    for w in words:
+        w = w.lower()
+        if w in chiasmus.IGNORED_WORDS:
+            continue
+        for anchor, data in lexicons.items():
+            if w in data.get("nouns", []) or w in data.get("verbs", []):
+                votes[anchor] += 1
+    if not votes:
+        return "Neutral"
+    return votes.most_common(1)[0][0]
+
+
+# --- harness -----------------------------------------------------------------
+def _best_of(fn, sentences, repeat):
+    best = float("inf")
+    out = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = [fn(s) for s in sentences]
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--n", type=int, default=5000, help="number of sentences")
+    ap.add_argument("--words", type=int, default=12, help="words per sentence")
+    ap.add_argument("--repeat", type=int, default=3, help="runs per path (best is reported)")
+    args = ap.parse_args()
+
+    lexicons = core.load_lexicons()
+    vocab = sorted({w for data in lexicons.values() for f in ("nouns", "verbs", "adjectives") for w in data.get(f, [])})
+    vocab += ["zyx", "qwerty", "The", "And"]  # misses and ignored words
+    rng = random.Random(0)
+    sentences = [[rng.choice(vocab) for _ in range(args.words)] for _ in range(args.n)]
+
+    t0 = time.perf_counter()
+    chiasmus.build_word_index(lexicons)
+    t_build = time.perf_counter() - t0
+    chiasmus.get_word_index()
+
+    t_legacy, legacy = _best_of(lambda s: legacy_analyze_context_vector(s, lexicons), sentences, args.repeat)
+    t_new, new = _best_of(chiasmus.analyze_context_vector, sentences, args.repeat)
+
+    if legacy != new:
+        bad = next(i for i, (a, b) in enumerate(zip(legacy, new)) if a != b)
+        print(f"MISMATCH at sentence {bad}: {legacy[bad]!r} != {new[bad]!r}")
+        return 1
+
+    per = lambda t: t / args.n * 1e6  # noqa: E731
+    print(f"sentences: {args.n} x {args.words} words (identical anchors)")
+    print(f"index build: {t_build * 1e3:.1f} ms (once per lexicon load)")
+    print(f"scan:  {t_legacy:.3f}s  ({per(t_legacy):.1f} us/sentence)")
+    print(f"index: {t_new:.3f}s  ({per(t_new):.1f} us/sentence)")
+    print(f"speedup: {t_legacy / t_new:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmark: index-based word generation vs the jamo-search formulation.
+
+Usage:
+    python scripts/bench_word_generation.py [--n 20000] [--repeat 3]
+
+Word generation is dominated by seeding one Mersenne Twister per word
+(``get_rng``), so syllable construction is also timed on its own. The legacy
+path below is the original implementation (pick jamo, then ``list.index`` them
+back in ``compose_hangul_block``). Both paths are run over the same seeds and
+must produce byte-identical words. The indexed path is timed through
+``core._generate_word``, bypassing the word memo, so every repeat generates.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from zyntalic import core  # noqa: E402
+
+
+# --- legacy reference --------------------------------------------------------
+def _legacy_compose(ch, ju, jo):
+    try:
+        l_idx = core.CHOSEONG.index(ch)
+        v_idx = core.JUNGSEONG.index(ju)
+        t_idx = core.JONGSEONG.index(jo)
+    except ValueError:
+        return ch + ju + jo
+    return chr(0xAC00 + (l_idx * 21 + v_idx) * 28 + t_idx)
+
+
+def _legacy_hangul(rng):
+    return _legacy_compose(rng.choice(core.CHOSEONG), rng.choice(core.JUNGSEONG), rng.choice(core.JONGSEONG))
+
+
+def _legacy_latin(rng):
+    c = rng.choice(core.POLISH_CONSONANTS)
+    v = rng.choice(core.POLISH_VOWELS)
+    tail = rng.choice(["", rng.choice(core.POLISH_CONSONANTS)])
+    return c + v + tail
+
+
+def _legacy_syllable(rng, pos="noun"):
+    r = rng.random()
+    if pos == "noun":
+        return _legacy_hangul(rng) if r < 0.85 else _legacy_latin(rng)
+    if pos == "verb":
+        return _legacy_latin(rng) if r < 0.85 else _legacy_hangul(rng)
+    return _legacy_hangul(rng) if r < 0.5 else _legacy_latin(rng)
+
+
+def legacy_generate_word(seed_key):
+    rng = core.get_rng(seed_key)
+    sylls = [
+        _legacy_syllable(rng, pos=rng.choice(["noun", "verb"])),
+        _legacy_syllable(rng, pos=rng.choice(["noun", "verb"])),
+        _legacy_syllable(rng, pos=rng.choice(["noun", "verb"])),
+    ]
+    if rng.random() < 0.3:
+        sylls[1] = sylls[1] + rng.choice(["ć", "ść", "rz", "ż"])
+    return "".join(sylls)
+
+
+# --- harness -----------------------------------------------------------------
+def _best_of(fn, seeds, repeat):
+    best = float("inf")
+    out = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = [fn(s) for s in seeds]
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def _time_syllables(fn, n, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        rng = core.get_rng("bench")
+        t0 = time.perf_counter()
+        for _ in range(n):
+            fn(rng)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--n", type=int, default=20000, help="number of seeds")
+    ap.add_argument("--repeat", type=int, default=3, help="runs per path (best is reported)")
+    args = ap.parse_args()
+
+    per = lambda t: t / args.n * 1e6  # noqa: E731
+    for label, legacy_fn, new_fn in (
+        ("hangul syllable", _legacy_hangul, core.create_hangul_syllable),
+        ("latin syllable", _legacy_latin, core.create_latin_syllable),
+    ):
+        t_old = _time_syllables(legacy_fn, args.n, args.repeat)
+        t_idx = _time_syllables(new_fn, args.n, args.repeat)
+        print(f"{label:<16} legacy {per(t_old):.2f} us  indexed {per(t_idx):.2f} us  ({t_old / t_idx:.2f}x)")
+
+    seeds = [f"bench:{i}" for i in range(args.n)]
+    t_legacy, legacy = _best_of(legacy_generate_word, seeds, args.repeat)
+    t_new, new = _best_of(core._generate_word, seeds, args.repeat)  # unmemoized
+
+    if legacy != new:
+        bad = next(i for i, (a, b) in enumerate(zip(legacy, new)) if a != b)
+        print(f"MISMATCH at seed {seeds[bad]!r}: {legacy[bad]!r} != {new[bad]!r}")
+        return 1
+
+    print(f"words:   {args.n} (identical output)")
+    print(f"legacy:  {t_legacy:.3f}s  ({per(t_legacy):.2f} us/word)")
+    print(f"indexed: {t_new:.3f}s  ({per(t_new):.2f} us/word)")
+    print(f"speedup: {t_legacy / t_new:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -38,6 +38,7 @@ from zyntalic.core import (
     load_lexicons,
     get_rng
 )
+from zyntalic.utils.phrase_matcher import PhraseMatcher
 
 try:
     from zyntalic.embeddings import embed_text
@@ -300,22 +301,26 @@ class ZyntalicEmbeddingsGenerator:
             "Hope springs eternal"
         ]
         
+        # longest known phrase first, one pass per sentence
+        matcher = PhraseMatcher(w for vocab in self.vocabulary_mappings.values() for w in vocab)
         for sentence in test_sentences[:num_samples]:
             words = sentence.lower().split()
             zyntalic_words = []
             
-            for word in words:
+            for chunk, matched in matcher.segment(words):
+                phrase = " ".join(chunk)
                 # Try to find in vocabulary mappings
                 found = False
-                for category, vocab in self.vocabulary_mappings.items():
-                    if word in vocab:
-                        zyntalic_words.append(vocab[word])
-                        found = True
-                        break
+                if matched:
+                    for category, vocab in self.vocabulary_mappings.items():
+                        if phrase in vocab:
+                            zyntalic_words.append(vocab[phrase])
+                            found = True
+                            break
                 
                 if not found:
                     # Generate on the fly
-                    zyntalic_words.append(self._generate_zyntalic_word(word, "noun"))
+                    zyntalic_words.append(self._generate_zyntalic_word(phrase, "noun"))
             
             samples.append({
                 "english": sentence,
@@ -1,10 +1,11 @@
 import re
 import random
 import hashlib
-import os
-import json
 from collections import Counter
 
+from .utils.lru import LRUCache
+from .utils.rng import get_rng
+
 # ---------------------------------------------------------
 # 1. HANGUL MAPPING (The "Periodic Table" of Meaning)
 # ---------------------------------------------------------
@@ -18,26 +19,34 @@ CONSONANT_MAP = [
 VOWEL_HARMONY = ["ㅡ", "ㅗ", "ㅜ"] # Use for Agreement/Reflection
 VOWEL_CONFLICT = ["ㅣ", "ㅐ", "ㅔ", "ㅑ"] # Use for Irony/Shift
 
+_ANCHOR_CONSONANTS = {}
+
 def get_anchor_consonant(anchor_name):
     """Maps an anchor (e.g., Iliad) to a specific Consonant (e.g., ㄱ)."""
     # Deterministic mapping
-    idx = int(hashlib.md5(anchor_name.encode()).hexdigest(), 16) % len(CONSONANT_MAP)
-    return CONSONANT_MAP[idx]
+    cons = _ANCHOR_CONSONANTS.get(anchor_name)
+    if cons is None:
+        idx = int(hashlib.md5(anchor_name.encode()).hexdigest(), 16) % len(CONSONANT_MAP)
+        cons = _ANCHOR_CONSONANTS[anchor_name] = CONSONANT_MAP[idx]
+    return cons
+
+CHOSEONG = ["ㄱ","ㄲ","ㄴ","ㄷ","ㄸ","ㄹ","ㅁ","ㅂ","ㅃ","ㅅ","ㅆ","ㅇ","ㅈ","ㅉ","ㅊ","ㅋ","ㅌ","ㅍ","ㅎ"]
+JUNGSEONG = ["ㅏ","ㅐ","ㅑ","ㅒ","ㅓ","ㅔ","ㅕ","ㅖ","ㅗ","ㅘ","ㅙ","ㅚ","ㅛ","ㅜ","ㅝ","ㅞ","ㅟ","ㅠ","ㅡ","ㅢ","ㅣ"]
+JONGSEONG = ["","ㄱ","ㄲ","ㄳ","ㄴ","ㄵ","ㄶ","ㄷ","ㄹ","ㄺ","ㄻ","ㄼ","ㄽ","ㄾ","ㄿ","ㅀ","ㅁ","ㅂ","ㅄ","ㅅ","ㅆ","ㅇ","ㅈ","ㅊ","ㅋ","ㅌ","ㅍ","ㅎ"]
+_CHOSEONG_INDEX = {c: i for i, c in enumerate(CHOSEONG)}
+_JUNGSEONG_INDEX = {c: i for i, c in enumerate(JUNGSEONG)}
+_JONGSEONG_INDEX = {c: i for i, c in enumerate(JONGSEONG)}
 
 def compose_hangul(initial, vowel, final):
     """Builds the block from the 3 parts."""
-    CHOSEONG = ["ㄱ","ㄲ","ㄴ","ㄷ","ㄸ","ㄹ","ㅁ","ㅂ","ㅃ","ㅅ","ㅆ","ㅇ","ㅈ","ㅉ","ㅊ","ㅋ","ㅌ","ㅍ","ㅎ"]
-    JUNGSEONG = ["ㅏ","ㅐ","ㅑ","ㅒ","ㅓ","ㅔ","ㅕ","ㅖ","ㅗ","ㅘ","ㅙ","ㅚ","ㅛ","ㅜ","ㅝ","ㅞ","ㅟ","ㅠ","ㅡ","ㅢ","ㅣ"]
-    JONGSEONG = ["","ㄱ","ㄲ","ㄳ","ㄴ","ㄵ","ㄶ","ㄷ","ㄹ","ㄺ","ㄻ","ㄼ","ㄽ","ㄾ","ㄿ","ㅀ","ㅁ","ㅂ","ㅄ","ㅅ","ㅆ","ㅇ","ㅈ","ㅊ","ㅋ","ㅌ","ㅍ","ㅎ"]
-
     try:
         # Map input chars to standard Hangul indices
-        ci = CHOSEONG.index(initial)
-        vi = JUNGSEONG.index(vowel)
-        ti = JONGSEONG.index(final) if final else 0
+        ci = _CHOSEONG_INDEX[initial]
+        vi = _JUNGSEONG_INDEX[vowel]
+        ti = _JONGSEONG_INDEX[final] if final else 0
         base = 0xAC00
         return chr(base + (ci * 21 + vi) * 28 + ti)
-    except:
+    except (KeyError, TypeError):
         return initial # Fallback if mapping fails
 
 # ---------------------------------------------------------
@@ -46,7 +55,20 @@ def compose_hangul(initial, vowel, final):
 LATIN_CONSONANTS = "bcćdđfghjklłmnńprsśtvwzźż"
 LATIN_VOWELS     = "aąeęioóuy"
 
+# Latin words are a pure function of the text; sentences also depend on the
+# lexicons' word index, so _SENTENCE_MEMO is emptied whenever that index is rebuilt.
+_LATIN_WORD_MEMO = LRUCache(maxsize=65536)
+_SENTENCE_MEMO = LRUCache(maxsize=16384)
+
 def generate_latin_word(text):
+    """Deterministic Latin-script word for ``text`` (memoized)."""
+    word = _LATIN_WORD_MEMO.get(text)
+    if word is None:
+        word = _generate_latin_word(text)
+        _LATIN_WORD_MEMO.put(text, word)
+    return word
+
+def _generate_latin_word(text):
     seed = int(hashlib.sha256(text.encode()).hexdigest()[:8], 16)
     rng = random.Random(seed)
     length = rng.choice([1, 2, 2, 3])
@@ -58,38 +80,66 @@ def generate_latin_word(text):
 # ---------------------------------------------------------
 # 3. THE CHIASMUS DETECTOR
 # ---------------------------------------------------------
-LEXICON_CACHE = {}
-def load_lexicons():
-    if LEXICON_CACHE: return
-    if not os.path.exists("lexicon"): return
-    for f in os.listdir("lexicon"):
-        if f.endswith(".json"):
-            with open(f"lexicon/{f}", "r", encoding="utf-8") as file:
-                LEXICON_CACHE[f.replace(".json", "")] = json.load(file)
+IGNORED_WORDS = frozenset({"the","and","is","of","to","in","but","not"})
+
+# (lexicon dict it was built from, word -> anchors); rebuilt when core hands back
+# a different lexicon object, e.g. after clear_resource_cache("lexicons").
+_WORD_INDEX = (None, {})
+
+
+def build_word_index(lexicons):
+    """Invert ``{anchor: {"nouns": [...], "verbs": [...]}}`` into ``word -> (anchors...)``.
+
+    Each word lists every anchor whose nouns or verbs contain it, once, in
+    lexicon order, so voting through the index visits anchors exactly as a
+    scan over the lexicons would.
+    """
+    index = {}
+    for anchor, data in lexicons.items():
+        words = {w for field in ("nouns", "verbs") for w in data.get(field, []) if isinstance(w, str)}
+        for w in words:
+            index.setdefault(w, []).append(anchor)
+    return {w: tuple(anchors) for w, anchors in index.items()}
+
+
+def get_word_index():
+    """Word -> anchors index over ``core.load_lexicons()``, built once per lexicon load."""
+    global _WORD_INDEX
+    from . import core
+
+    lexicons = core.load_lexicons()
+    built_from, index = _WORD_INDEX
+    if built_from is not lexicons:
+        index = build_word_index(lexicons)
+        _WORD_INDEX = (lexicons, index)
+        _SENTENCE_MEMO.clear()  # sigils voted against the old lexicons
+    return index
+
 
 def analyze_context_vector(words):
     """Returns the dominant Anchor for a list of words."""
-    load_lexicons()
+    index = get_word_index()
     votes = Counter()
-    ignore = {"the","and","is","of","to","in","but","not"}
-    
+
     for w in words:
         w = w.lower()
-        if w in ignore: continue
-        for anchor, data in LEXICON_CACHE.items():
-            if w in data.get("nouns", []) or w in data.get("verbs", []):
-                votes[anchor] += 1
-    
+        if w in IGNORED_WORDS: continue
+        for anchor in index.get(w, ()):
+            votes[anchor] += 1
+
     if not votes: return "Neutral"
     return votes.most_common(1)[0][0]
 
 def generate_mirror_sigil(sentence_text):
     """
     Splits the sentence, compares the halves, and builds the Sigil.
+
+    The vowel is drawn from an RNG seeded by the text, so the same sentence
+    always gets the same sigil. Returns ("", "None") when there are no words.
     """
     # 1. Split sentence into two halves (Thesis / Antithesis)
     words = re.findall(r'\w+', sentence_text)
-    if not words: return ""
+    if not words: return "", "None"
     
     midpoint = len(words) // 2
     first_half = words[:midpoint]
@@ -104,13 +154,14 @@ def generate_mirror_sigil(sentence_text):
     cons_B = get_anchor_consonant(context_B) # Antithesis (Bottom)
     
     # 4. Determine Relationship (The Vowel)
+    rng = get_rng(f"sigil::{sentence_text}")
     if context_A == context_B:
         # Pure Reflection / Continuation (Horizontal Vowel)
-        vowel = random.choice(VOWEL_HARMONY)
+        vowel = rng.choice(VOWEL_HARMONY)
         rel_type = "Reflection"
     else:
         # Irony / Conflict / Shift (Vertical Vowel)
-        vowel = random.choice(VOWEL_CONFLICT)
+        vowel = rng.choice(VOWEL_CONFLICT)
         rel_type = "Irony"
         
     # 5. Build the Sigil
@@ -120,42 +171,77 @@ def generate_mirror_sigil(sentence_text):
 # ---------------------------------------------------------
 # 4. TRANSLATOR LOOP
 # ---------------------------------------------------------
-def translate_saramago_chiasmus(text):
+def chiasmus_sentence(sent):
+    """Translate one sentence; returns (text, sigil, relation type).
+
+    Memoized per sentence for the current lexicons (a reload empties the memo).
+    """
+    get_word_index()  # notices a lexicon reload before the memo is consulted
+    hit = _SENTENCE_MEMO.get(sent)
+    if hit is None:
+        hit = _chiasmus_sentence(sent)
+        _SENTENCE_MEMO.put(sent, hit)
+    return hit
+
+
+def _chiasmus_sentence(sent):
+    # 1. Translate Words (Latin Body)
+    raw_words = sent.split()
+    trans_words = []
+    clean_text_for_analysis = []
+
+    for w in raw_words:
+        clean = "".join(filter(str.isalpha, w))
+        clean_text_for_analysis.append(clean)
+        if clean:
+            tw = generate_latin_word(clean)
+            punct = "".join(filter(lambda x: not x.isalpha(), w))
+            trans_words.append(tw + punct)
+        else:
+            trans_words.append(w)
+
+    body = " ".join(trans_words)
+    if body.endswith("."): body = body[:-1]
+
+    # 2. Generate the Chiasmus Sigil
+    sigil, rtype = generate_mirror_sigil(" ".join(clean_text_for_analysis))
+
+    # 3. Append
+    return (f"{body} {sigil}" if sigil else body), sigil, rtype
+
+
+def translate_chiasmus(text):
+    """Engine entry point: chiasmus rendering of ``text``. Deterministic and silent."""
+    sentences = re.split(r'(?<=[.!?])\s+', text)
+    return " ".join(chiasmus_sentence(sent)[0] for sent in sentences if sent.strip())
+
+
+def translate_chiasmus_batch(texts):
+    """``[translate_chiasmus(t) for t in texts]``; repeated sentences and words are computed once."""
+    return [translate_chiasmus(t) for t in texts]
+
+
+def clear_chiasmus_memo():
+    _LATIN_WORD_MEMO.clear()
+    _SENTENCE_MEMO.clear()
+
+
+def translate_saramago_chiasmus(text, verbose=False):
+    """Chiasmus rendering of ``text``; ``verbose`` prints the sigil table as it goes."""
     sentences = re.split(r'(?<=[.!?])\s+', text)
     output = []
     
-    print(f"{'SIGIL':<5} | {'TYPE':<12} | {'SENTENCE'}")
-    print("-" * 60)
+    if verbose:
+        print(f"{'SIGIL':<5} | {'TYPE':<12} | {'SENTENCE'}")
+        print("-" * 60)
 
     for sent in sentences:
         if not sent.strip(): continue
-        
-        # 1. Translate Words (Latin Body)
-        raw_words = sent.split()
-        trans_words = []
-        clean_text_for_analysis = []
-        
-        for w in raw_words:
-            clean = "".join(filter(str.isalpha, w))
-            clean_text_for_analysis.append(clean)
-            if clean:
-                tw = generate_latin_word(clean)
-                punct = "".join(filter(lambda x: not x.isalpha(), w))
-                trans_words.append(tw + punct)
-            else:
-                trans_words.append(w)
-                
-        body = " ".join(trans_words)
-        if body.endswith("."): body = body[:-1]
-        
-        # 2. Generate the Chiasmus Sigil
-        sigil, rtype = generate_mirror_sigil(" ".join(clean_text_for_analysis))
-        
-        # 3. Append
-        final = f"{body} {sigil}"
+        final, sigil, rtype = chiasmus_sentence(sent)
         output.append(final)
         
-        print(f"{sigil:<5} | {rtype:<12} | {sent[:40]}...")
+        if verbose:
+            print(f"{sigil:<5} | {rtype:<12} | {sent[:40]}...")
 
     return " ".join(output)
 
@@ -169,7 +255,7 @@ if __name__ == "__main__":
     """
     
     print("\n--- PROCESSING ---")
-    res = translate_saramago_chiasmus(text)
+    res = translate_saramago_chiasmus(text, verbose=True)
     
     print("\n--- FINAL TEXT ---")
     print(res)
\ No newline at end of file
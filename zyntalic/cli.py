@@ -6,14 +6,18 @@ import json
 import sys
 from typing import Optional
 
-from .translator import translate_text
+from .translator import translate_iter, translate_text
 
 def _read_stdin() -> str:
     return sys.stdin.read()
 
 def cmd_translate(args: argparse.Namespace) -> int:
-    text = args.text if args.text is not None else _read_stdin()
-    rows = translate_text(text, mirror_rate=args.mirror_rate, engine=args.engine)
+    if args.text is None and args.format != "json" and args.workers <= 1:
+        # stream stdin: rows are written as sentences complete, memory stays bounded
+        rows = translate_iter(sys.stdin, mirror_rate=args.mirror_rate, engine=args.engine)
+    else:
+        text = args.text if args.text is not None else _read_stdin()
+        rows = translate_text(text, mirror_rate=args.mirror_rate, engine=args.engine, workers=args.workers)
     if args.format == "plain":
         for r in rows:
             sys.stdout.write(r["target"] + ("\n" if not r["target"].endswith("\n") else ""))
@@ -28,6 +32,18 @@ def cmd_translate(args: argparse.Namespace) -> int:
         sys.stdout.write(json.dumps(r, ensure_ascii=False) + "\n")
     return 0
 
+def cmd_snapshot(args: argparse.Namespace) -> int:
+    from .core import build_resource_snapshot
+    path = build_resource_snapshot(args.out, lexicon_dir=args.lexicon_dir, mappings_path=args.mappings)
+    print(path)
+    return 0
+
+def cmd_lemma_table(args: argparse.Namespace) -> int:
+    from .translator import build_lemma_table
+    path = build_lemma_table(args.out, mirror_rates=args.mirror_rates)
+    print(path)
+    return 0
+
 def cmd_version(_: argparse.Namespace) -> int:
     from . import __version__
     print(__version__)
@@ -39,11 +55,23 @@ def build_parser() -> argparse.ArgumentParser:
 
     t = sub.add_parser("translate", help="Translate text to Zyntalic")
     t.add_argument("text", nargs="?", default=None, help="Text to translate (or stdin if omitted)")
-    t.add_argument("--engine", choices=["core","chiasmus"], default="core")
+    t.add_argument("--engine", choices=["core","chiasmus","lexical"], default="core")
     t.add_argument("--mirror-rate", type=float, default=0.8)
     t.add_argument("--format", choices=["jsonl","json","plain"], default="jsonl")
+    t.add_argument("--workers", type=int, default=1, help="Process-pool size for large inputs (1 = serial)")
     t.set_defaults(func=cmd_translate)
 
+    s = sub.add_parser("snapshot", help="Compile lexicons + vocabulary mappings into a binary snapshot")
+    s.add_argument("--out", default=None, help="Snapshot path (default: $ZYNTALIC_SNAPSHOT or data/cache/)")
+    s.add_argument("--lexicon-dir", default="lexicon")
+    s.add_argument("--mappings", default="data/embeddings/vocabulary_mappings.json")
+    s.set_defaults(func=cmd_snapshot)
+
+    lt = sub.add_parser("lemma-table", help="Precompute core translations of the lexicon vocabulary")
+    lt.add_argument("--out", default=None, help="Table path (default: $ZYNTALIC_LEMMA_TABLE or data/cache/)")
+    lt.add_argument("--mirror-rates", type=float, nargs="+", default=[0.3, 0.8])
+    lt.set_defaults(func=cmd_lemma_table)
+
     v = sub.add_parser("version", help="Print version")
     v.set_defaults(func=cmd_version)
 
@@ -12,9 +12,17 @@ import json
 import math
 import os
 import random
+import weakref
+from array import array
+from bisect import bisect_left
+from itertools import accumulate, repeat
 from typing import Dict, List, Optional, Tuple
 
-from .syntax import ParsedSentence, to_zyntalic_order
+from .syntax import ParsedSentence, mark_tense, pluralize, to_zyntalic_order
+from .utils.lru import LRUCache
+from .utils.phrase_matcher import PhraseMatcher
+from .utils.registry import ResourceRegistry
+from .utils.snapshot import make_section, read_section, write_snapshot
 
 # --- Deterministic RNG --------------------------------------------------------
 try:
@@ -31,9 +39,13 @@ try:  # pragma: no cover - optional
 except Exception:  # pragma: no cover - optional
     np = None
 try:  # pragma: no cover - optional
-    from .embeddings import embed_text  # type: ignore
+    from .embeddings import embed_text, embed_text_array, embedding_backend  # type: ignore
 except Exception:  # pragma: no cover - optional
     embed_text = None
+    embed_text_array = None
+
+    def embedding_backend() -> str:
+        return "core-pseudo-v1"
 
 # -------------------- Alphabet --------------------
 # Standard Hangul Jamo for deterministic block composition.
@@ -140,29 +152,64 @@ ANCHORS = [
     "Spinoza_Ethics",
 ]
 
+# -------------------- Resource Registry --------------------
+_RESOURCES = ResourceRegistry()
+
+
+def clear_resource_cache(name: Optional[str] = None) -> None:
+    """Drop loaded resources (all, or one kind such as "lexicons") so they reload,
+    together with the memoized outputs built from them."""
+    _RESOURCES.clear(name)
+    if name in (None, "vocabulary_mappings"):
+        _RESOURCES.clear("sentence_vocab")
+        _TOKEN_MEMO.clear()
+    if name in (None, "vocabulary_mappings", "lexicons"):
+        _RESOURCES.clear("phrase_matcher")
+        # entry sentences are drawn from lexicon pools and mapped vocabulary
+        _ENTRY_MEMO.clear()
+
+
 # -------------------- Lexicon Prior --------------------
-_LEXICON_CACHE: Optional[Dict[str, dict]] = None
-_VOCAB_MAPPINGS_CACHE: Optional[Dict[str, Dict[str, str]]] = None
-_PROJECTION_CACHE_SENTINEL = object()
-_PROJECTION_CACHE = _PROJECTION_CACHE_SENTINEL
 
+_DEFAULT_VOCAB_MAPPINGS = "data/embeddings/vocabulary_mappings.json"
+_BUNDLED_LEXICON_SOURCE = "zyntalic.resources.lexicon"
 
-def load_vocabulary_mappings(filepath: str = "data/embeddings/vocabulary_mappings.json") -> Dict[str, Dict[str, str]]:
-    """Load pre-generated vocabulary mappings from English to Zyntalic.
 
-    Tries the provided path, then falls back to a repo-relative default. Returns
-    an empty mapping on any error so translation can proceed without hard failure.
+def _vocab_mappings_source(filepath: str = _DEFAULT_VOCAB_MAPPINGS) -> Optional[str]:
+    """Path ``load_vocabulary_mappings`` would read, or None."""
+    if os.path.exists(filepath):
+        return os.path.abspath(filepath)
+    from pathlib import Path
+    alt_path = Path(__file__).resolve().parents[1] / "data" / "embeddings" / "vocabulary_mappings.json"
+    return str(alt_path) if alt_path.exists() else None
+
+
+def _lexicon_sources(dirpath: str = "lexicon") -> Tuple[str, List[str]]:
+    """(source label, json paths) that ``load_lexicons`` would read.
+
+    The path list is empty when the bundled lexicons are not plain files on disk
+    (e.g. zipped installs); those are always parsed directly.
     """
-    global _VOCAB_MAPPINGS_CACHE
-    if _VOCAB_MAPPINGS_CACHE is not None:
-        return _VOCAB_MAPPINGS_CACHE
-    
+    if dirpath and os.path.isdir(dirpath):
+        files = [os.path.join(dirpath, fn) for fn in os.listdir(dirpath) if fn.endswith(".json")]
+        return os.path.abspath(dirpath), files
+    try:
+        from importlib import resources
+        from pathlib import Path
+        base = resources.files(_BUNDLED_LEXICON_SOURCE)
+        if not isinstance(base, Path):
+            return _BUNDLED_LEXICON_SOURCE, []
+        return _BUNDLED_LEXICON_SOURCE, [str(p) for p in base.iterdir() if p.name.endswith(".json")]
+    except Exception:
+        return _BUNDLED_LEXICON_SOURCE, []
+
+
+def _read_vocabulary_mappings(filepath: str = _DEFAULT_VOCAB_MAPPINGS) -> Dict[str, Dict[str, str]]:
     # Try to load from file (direct path)
     if os.path.exists(filepath):
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
-                _VOCAB_MAPPINGS_CACHE = json.load(f)
-                return _VOCAB_MAPPINGS_CACHE
+                return json.load(f)
         except Exception:
             pass
 
@@ -173,27 +220,15 @@ def load_vocabulary_mappings(filepath: str = "data/embeddings/vocabulary_mapping
         alt_path = repo_root / "data" / "embeddings" / "vocabulary_mappings.json"
         if alt_path.exists():
             with alt_path.open('r', encoding='utf-8') as f:
-                _VOCAB_MAPPINGS_CACHE = json.load(f)
-                return _VOCAB_MAPPINGS_CACHE
+                return json.load(f)
     except Exception:
         pass
     
     # Return empty dict if not found
-    _VOCAB_MAPPINGS_CACHE = {}
-    return _VOCAB_MAPPINGS_CACHE
-
-
-def load_lexicons(dirpath: str = "lexicon") -> Dict[str, dict]:
-    """Load anchor lexicons.
+    return {}
 
-    Resolution order:
-    1) If ``dirpath`` exists on disk, load ``*.json`` files from there.
-    2) Otherwise load bundled lexicons from ``zyntalic.resources.lexicon``.
-    """
-    global _LEXICON_CACHE
-    if _LEXICON_CACHE is not None:
-        return _LEXICON_CACHE
 
+def _read_lexicons(dirpath: str = "lexicon") -> Dict[str, dict]:
     data: Dict[str, dict] = {}
 
     # 1) Local filesystem (dev / overrides)
@@ -208,13 +243,12 @@ def load_lexicons(dirpath: str = "lexicon") -> Dict[str, dict]:
                 data[key] = obj
             except Exception:
                 continue
-        _LEXICON_CACHE = data
-        return _LEXICON_CACHE
+        return data
 
     # 2) Bundled resources
     try:
         from importlib import resources
-        base = resources.files("zyntalic.resources.lexicon")
+        base = resources.files(_BUNDLED_LEXICON_SOURCE)
         for entry in base.iterdir():
             if not entry.name.endswith(".json"):
                 continue
@@ -226,9 +260,69 @@ def load_lexicons(dirpath: str = "lexicon") -> Dict[str, dict]:
     except Exception:
         # If resources aren't available (e.g., frozen apps), just return empty.
         data = {}
+    return data
 
-    _LEXICON_CACHE = data
-    return _LEXICON_CACHE
+
+def load_vocabulary_mappings(filepath: str = _DEFAULT_VOCAB_MAPPINGS) -> Dict[str, Dict[str, str]]:
+    """Load pre-generated vocabulary mappings from English to Zyntalic.
+
+    Tries the provided path, then falls back to a repo-relative default. Returns
+    an empty mapping on any error so translation can proceed without hard failure.
+    A fresh compiled snapshot (see ``build_resource_snapshot``) is used instead
+    of parsing the JSON when available.
+    """
+    def build():
+        source = _vocab_mappings_source(filepath)
+        if source is not None:
+            cached = read_section("vocabulary_mappings", source, [source])
+            if cached is not None:
+                return cached
+        return _read_vocabulary_mappings(filepath)
+
+    return _RESOURCES.get(("vocabulary_mappings", filepath), build)
+
+
+def load_lexicons(dirpath: str = "lexicon") -> Dict[str, dict]:
+    """Load anchor lexicons.
+
+    Resolution order:
+    1) If ``dirpath`` exists on disk, load ``*.json`` files from there.
+    2) Otherwise load bundled lexicons from ``zyntalic.resources.lexicon``.
+
+    Either way a fresh compiled snapshot of the same files is preferred over
+    parsing them (see ``build_resource_snapshot``).
+    """
+    def build():
+        source, paths = _lexicon_sources(dirpath)
+        if paths:
+            cached = read_section("lexicons", source, paths)
+            if cached is not None:
+                return cached
+        return _read_lexicons(dirpath)
+
+    return _RESOURCES.get(("lexicons", dirpath), build)
+
+
+def build_resource_snapshot(
+    path: Optional[str] = None,
+    lexicon_dir: str = "lexicon",
+    mappings_path: str = _DEFAULT_VOCAB_MAPPINGS,
+) -> str:
+    """Compile lexicons and vocabulary mappings into one snapshot file.
+
+    Sections record their source files' size/mtime and a content hash; loaders
+    only use a section while it still matches. Returns the snapshot path.
+    """
+    sections = {}
+    source, paths = _lexicon_sources(lexicon_dir)
+    if paths:
+        sections["lexicons"] = make_section(source, paths, _read_lexicons(lexicon_dir))
+    vocab_source = _vocab_mappings_source(mappings_path)
+    if vocab_source is not None:
+        sections["vocabulary_mappings"] = make_section(
+            vocab_source, [vocab_source], _read_vocabulary_mappings(mappings_path)
+        )
+    return write_snapshot(sections, path)
 
 
 def _weighted_sample(rng, pool, weights):
@@ -263,16 +357,9 @@ def _mix_lists(anchors, weights, field, base_list, k_sharpen=1.0):
 
 def _choose_motif(rng, anchors, weights):
     """Deterministic motif selection."""
-    lex = load_lexicons()
-    motif_pool, motif_w = [], []
-    for a, w in zip(anchors, weights):
-        if a in lex and "motifs" in lex[a]:
-            for pair in lex[a]["motifs"]:
-                if isinstance(pair, list) and len(pair) == 2:
-                    motif_pool.append(tuple(pair))
-                    motif_w.append(max(1e-6, w))
-    if motif_pool:
-        return _weighted_sample(rng, motif_pool, motif_w)
+    table = _motif_table(anchors, weights)
+    if table.pool:
+        return table.sample(rng)
     # fallback generic motifs
     defaults = [
         ("light", "dark"),
@@ -287,19 +374,149 @@ def _choose_motif(rng, anchors, weights):
     return defaults[int(rng.random() * len(defaults))]
 
 
+# -------------------- Sampling Tables --------------------
+class _SamplingTable:
+    """Pool with precomputed cumulative weights.
+
+    ``sample`` draws by bisection and returns exactly what ``_weighted_sample``
+    returns for the same pool, weights and RNG state: the cumulative array is
+    built with the same left-to-right float additions as the linear scan.
+    """
+
+    __slots__ = ("pool", "cum", "total")
+
+    def __init__(self, pool, weights):
+        self.pool = pool
+        self.cum = array("d", accumulate(weights))
+        self.total = sum(weights)
+
+    def sample(self, rng):
+        if not self.pool:
+            return None
+        r = rng.random() * self.total
+        i = bisect_left(self.cum, r)
+        return self.pool[i] if i < len(self.pool) else self.pool[-1]
+
+
+# Tables are built per call: the effective weights come from each lemma's
+# anchor softmax and are practically never repeated, and any quantization of
+# them would change draws. Assembling the pool is cheap; the gain is the
+# C-level cumulative sum plus bisection instead of two Python loops.
+def _sampling_table(anchors, weights, field, base_list, k_sharpen=1.0) -> _SamplingTable:
+    """Sampling table equivalent to ``_mix_lists`` + ``_weighted_sample``."""
+    lex = load_lexicons()
+    pool, wts = [], []
+    for a, w in zip(anchors, weights):
+        if a in lex and field in lex[a]:
+            toks = lex[a][field]
+            pool.extend(toks)
+            wts.extend(repeat(max(1e-6, w**k_sharpen), len(toks)))
+    # smooth with base list
+    pool.extend(base_list)
+    wts.extend(repeat(0.2, len(base_list)))
+    return _SamplingTable(pool, wts)
+
+
+def _motif_table(anchors, weights) -> _SamplingTable:
+    """Sampling table over the anchors' motif pairs."""
+    lex = load_lexicons()
+    pool, wts = [], []
+    for a, w in zip(anchors, weights):
+        if a in lex and "motifs" in lex[a]:
+            for pair in lex[a]["motifs"]:
+                if isinstance(pair, list) and len(pair) == 2:
+                    pool.append(tuple(pair))
+                    wts.append(max(1e-6, w))
+    return _SamplingTable(pool, wts)
+
+
+# -------------------- Memoization --------------------
+# Words, tails and entries are pure functions of (seed, mirror_rate, projection),
+# so they are memoized in bounded LRUs. Resize with ``configure_memo`` (0 turns a
+# layer off) and read hit/miss/eviction counters with ``memo_stats``.
+_WORD_MEMO = LRUCache(maxsize=65536)
+_TAIL_MEMO = LRUCache(maxsize=65536)
+_ENTRY_MEMO = LRUCache(maxsize=4096)
+# Anchor weights do not depend on mirror_rate, so they get their own layer.
+_ANCHOR_MEMO = LRUCache(maxsize=65536)
+# (role, token) -> Zyntalic word for the lexical engine; depends only on the vocabulary mappings.
+_TOKEN_MEMO = LRUCache(maxsize=65536)
+
+_PROJECTION_FINGERPRINTS: Dict[int, Tuple[object, str]] = {}
+
+
+def projection_fingerprint(W) -> Optional[str]:
+    """Content hash of a projection matrix (``None`` means no projection).
+
+    Hashed once per matrix object; treat ``W`` as immutable once it is in use.
+    """
+    if W is None:
+        return None
+    hit = _PROJECTION_FINGERPRINTS.get(id(W))
+    if hit is not None and hit[0]() is W:
+        return hit[1]
+
+    h = hashlib.blake2b(digest_size=16)
+    if hasattr(W, "tobytes"):
+        h.update(repr((getattr(W, "shape", None), str(getattr(W, "dtype", "")))).encode("utf-8"))
+        h.update(np.ascontiguousarray(W).tobytes() if np is not None else W.tobytes())
+    else:
+        h.update(repr(W).encode("utf-8"))
+    fp = h.hexdigest()
+
+    key = id(W)
+    try:
+        ref = weakref.ref(W, lambda _r: _PROJECTION_FINGERPRINTS.pop(key, None))
+    except TypeError:  # not weak-referenceable: just don't remember it
+        return fp
+    _PROJECTION_FINGERPRINTS[key] = (ref, fp)
+    return fp
+
+
+def configure_memo(
+    word: Optional[int] = None,
+    tail: Optional[int] = None,
+    entry: Optional[int] = None,
+    anchors: Optional[int] = None,
+    tokens: Optional[int] = None,
+) -> None:
+    """Set memo capacities (entries); ``None`` leaves a layer unchanged."""
+    for memo, size in (
+        (_WORD_MEMO, word), (_TAIL_MEMO, tail), (_ENTRY_MEMO, entry), (_ANCHOR_MEMO, anchors), (_TOKEN_MEMO, tokens)
+    ):
+        if size is not None:
+            memo.resize(size)
+
+
+def memo_stats() -> Dict[str, Dict]:
+    """Hit/miss/eviction counters for the word, tail, entry, anchor-weight and token memos."""
+    return {
+        "word": _WORD_MEMO.stats(),
+        "tail": _TAIL_MEMO.stats(),
+        "entry": _ENTRY_MEMO.stats(),
+        "anchors": _ANCHOR_MEMO.stats(),
+        "tokens": _TOKEN_MEMO.stats(),
+    }
+
+
+def clear_memo() -> None:
+    _WORD_MEMO.clear()
+    _TAIL_MEMO.clear()
+    _ENTRY_MEMO.clear()
+    _ANCHOR_MEMO.clear()
+    _TOKEN_MEMO.clear()
+
+
 # -------------------- Helpers --------------------
 def compose_hangul_block(ch: str, ju: str, jo: str) -> str:
     """Compose a Hangul syllable block from jamo lists."""
-    l_count, v_count, t_count = 19, 21, 28
-    s_base = 0xAC00
     try:
-        l_idx = CHOSEONG.index(ch)
-        v_idx = JUNGSEONG.index(ju)
-        t_idx = JONGSEONG.index(jo)
-    except ValueError:
+        l_idx = _CHOSEONG_INDEX[ch]
+        v_idx = _JUNGSEONG_INDEX[ju]
+        t_idx = _JONGSEONG_INDEX[jo]
+    except KeyError:
         return ch + ju + jo
-    s_index = (l_idx * v_count + v_idx) * t_count + t_idx
-    return chr(s_base + s_index)
+    return _HANGUL_BLOCKS[(l_idx * len(JUNGSEONG) + v_idx) * len(JONGSEONG) + t_idx]
 
 
 def fuse_syllables(root: str, marker: str) -> str:
@@ -336,18 +553,37 @@ def _mix(vecs, weights):
 
 
 # -------------------- Deterministic Syllables --------------------
+# The generators below work on indices into precomputed tables instead of
+# picking jamo and searching for them again. Every ``rng.choice`` is made over a
+# sequence of the same length as before, so RNG consumption -- and therefore
+# every generated word -- is byte-identical to the jamo-based formulation.
+_CHOSEONG_INDEX = {ch: i for i, ch in enumerate(CHOSEONG)}
+_JUNGSEONG_INDEX = {ju: i for i, ju in enumerate(JUNGSEONG)}
+_JONGSEONG_INDEX = {jo: i for i, jo in enumerate(JONGSEONG)}
+
+# All 19 * 21 * 28 precomposed blocks, indexed by (L * 21 + V) * 28 + T.
+_HANGUL_BLOCKS = tuple(chr(0xAC00 + i) for i in range(len(CHOSEONG) * len(JUNGSEONG) * len(JONGSEONG)))
+_L_OFFSETS = tuple(i * len(JUNGSEONG) * len(JONGSEONG) for i in range(len(CHOSEONG)))
+_V_OFFSETS = tuple(i * len(JONGSEONG) for i in range(len(JUNGSEONG)))
+_T_OFFSETS = tuple(range(len(JONGSEONG)))
+
+_TAIL_SLOTS = (0, 1)
+_POS_CHOICES = ("noun", "verb")
+_FUSION_MARKERS = ("ć", "ść", "rz", "ż")
+
+
 def create_hangul_syllable(rng) -> str:
-    ch = rng.choice(CHOSEONG)
-    ju = rng.choice(JUNGSEONG)
-    jo = rng.choice(JONGSEONG)
-    return compose_hangul_block(ch, ju, jo)
+    choice = rng.choice
+    return _HANGUL_BLOCKS[choice(_L_OFFSETS) + choice(_V_OFFSETS) + choice(_T_OFFSETS)]
 
 
 def create_latin_syllable(rng) -> str:
-    c = rng.choice(POLISH_CONSONANTS)
-    v = rng.choice(POLISH_VOWELS)
-    tail = rng.choice(["", rng.choice(POLISH_CONSONANTS)])
-    return c + v + tail
+    choice = rng.choice
+    c = choice(POLISH_CONSONANTS)
+    v = choice(POLISH_VOWELS)
+    t = choice(POLISH_CONSONANTS)
+    # same draw as choice(["", t]): slot 1 keeps the extra consonant
+    return c + v + t if choice(_TAIL_SLOTS) else c + v
 
 
 def create_syllable(rng, pos: str = "noun") -> str:
@@ -366,14 +602,15 @@ def create_syllable(rng, pos: str = "noun") -> str:
 
 def generate_word(seed_key: str) -> str:
     """Generate Zyntalic word deterministically from a seed string."""
+    return _WORD_MEMO.get_or_create(seed_key, lambda: _generate_word(seed_key))
+
+
+def _generate_word(seed_key: str) -> str:
     rng = get_rng(seed_key)
-    sylls = [
-        create_syllable(rng, pos=rng.choice(["noun", "verb"])),
-        create_syllable(rng, pos=rng.choice(["noun", "verb"])),
-        create_syllable(rng, pos=rng.choice(["noun", "verb"])),
-    ]
+    choice = rng.choice
+    sylls = [create_syllable(rng, choice(_POS_CHOICES)) for _ in range(3)]
     if rng.random() < 0.3:
-        sylls[1] = fuse_syllables(sylls[1], rng.choice(["ć", "ść", "rz", "ż"]))
+        sylls[1] = fuse_syllables(sylls[1], choice(_FUSION_MARKERS))
     return "".join(sylls)
 
 
@@ -399,27 +636,47 @@ def plain_sentence_anchored(rng, anchors, weights) -> str:
     base_noun = ["journey", "whisper", "echo", "saga", "pattern"]
     base_verb = ["weaves", "reveals", "hides", "balances"]
 
-    pool_adj, w_adj = _mix_lists(anchors, weights, "adjectives", base_adj)
-    pool_noun, w_noun = _mix_lists(anchors, weights, "nouns", base_noun)
-    pool_verb, w_verb = _mix_lists(anchors, weights, "verbs", base_verb)
+    adj_en = _sampling_table(anchors, weights, "adjectives", base_adj).sample(rng) or rng.choice(base_adj)
+    noun_en = _sampling_table(anchors, weights, "nouns", base_noun).sample(rng) or rng.choice(base_noun)
+    verb_en = _sampling_table(anchors, weights, "verbs", base_verb).sample(rng) or rng.choice(base_verb)
 
-    adj_en = _weighted_sample(rng, pool_adj, w_adj) or rng.choice(base_adj)
-    noun_en = _weighted_sample(rng, pool_noun, w_noun) or rng.choice(base_noun)
-    verb_en = _weighted_sample(rng, pool_verb, w_verb) or rng.choice(base_verb)
-
-    # Try to translate to Zyntalic
-    vocab_mappings = load_vocabulary_mappings()
-    
-    adj = vocab_mappings.get("adjectives", {}).get(adj_en, generate_word(f"adj::{adj_en}"))
-    noun = vocab_mappings.get("nouns", {}).get(noun_en, generate_word(f"noun::{noun_en}"))
-    verb = vocab_mappings.get("verbs", {}).get(verb_en, generate_word(f"verb::{verb_en}"))
+    # Translate to Zyntalic: mapped vocabulary, else a memoized generated word
+    vocab = _sentence_vocab()
+    adj = _sentence_word(vocab["adjectives"], "adj", adj_en)
+    noun = _sentence_word(vocab["nouns"], "noun", noun_en)
+    verb = _sentence_word(vocab["verbs"], "verb", verb_en)
 
     return f"{adj} {noun} {verb}"
 
 
+def _sentence_vocab() -> Dict[str, Dict[str, str]]:
+    """Per-category English -> Zyntalic tables used by ``plain_sentence_anchored``.
+
+    Seeded with every vocabulary mapping; words without one get their
+    ``generate_word`` fallback stored on first use, so assembly is a dict hit per slot.
+    """
+    def build():
+        mappings = load_vocabulary_mappings()
+        return {field: dict(mappings.get(field, {})) for field in ("adjectives", "nouns", "verbs")}
+
+    return _RESOURCES.get(("sentence_vocab", _DEFAULT_VOCAB_MAPPINGS), build)
+
+
+def _sentence_word(table: Dict[str, str], prefix: str, english: str) -> str:
+    try:
+        return table[english]
+    except KeyError:
+        word = table[english] = generate_word(f"{prefix}::{english}")
+        return word
+
+
 # -------------------Korean tail ------------------------
 def make_korean_tail(seed_key: str) -> str:
     """Deterministic Hangul-only tail used only in the final context block."""
+    return _TAIL_MEMO.get_or_create(seed_key, lambda: _make_korean_tail(seed_key))
+
+
+def _make_korean_tail(seed_key: str) -> str:
     rng = get_rng(f"kctx::{seed_key}")
     sylls = [create_hangul_syllable(rng) for _ in range(2)]
     if rng.random() < 0.5:
@@ -436,7 +693,106 @@ def make_context(seed_key: str, word: str, chosen_anchors: List[str], pos_hint:
     return f"⟦ctx:han={han}⟧"
 
 
+# -------------------- Lexical (token-level) --------------------
+# Tokens with no Zyntalic counterpart (the language has no articles; "will" is
+# carried by the future marker on the verb).
+_LEXICAL_SKIP = frozenset({"a", "an", "the", "will"})
+# Vocabulary tables tried in order, per syntactic role.
+_ROLE_FIELDS = {
+    "noun": ("nouns", "adjectives", "verbs"),
+    "verb": ("verbs", "nouns", "adjectives"),
+}
+
+
+def phrase_matcher() -> PhraseMatcher:
+    """Every vocabulary-mapping key and lexicon word compiled into one matcher.
+
+    Built once; lets the lexical engine translate known multiword expressions
+    as a unit instead of word by word.
+    """
+    def build():
+        phrases = [english for table in load_vocabulary_mappings().values() for english in table]
+        for data in load_lexicons().values():
+            for field in ("nouns", "verbs", "adjectives"):
+                phrases.extend(data.get(field, []))
+        return PhraseMatcher(phrases)
+
+    return _RESOURCES.get(("phrase_matcher", _DEFAULT_VOCAB_MAPPINGS, "lexicon"), build)
+
+
+def lexical_token(token: str, role: str = "noun") -> str:
+    """Zyntalic word for one English token (or phrase) in ``role`` ("noun" or "verb").
+
+    The token, then its lemma, is looked up in the vocabulary mappings; a miss
+    becomes a ``generate_word`` of the lemma. Memoized per (role, token).
+    """
+    key = (role, token.lower())
+    return _TOKEN_MEMO.get_or_create(key, lambda: _lexical_token(*key))
+
+
+def _lexical_token(role: str, token: str) -> str:
+    mappings = load_vocabulary_mappings()
+    lemma = lemmatize(token) or token
+    for form in dict.fromkeys((token, lemma)):
+        for field in _ROLE_FIELDS[role]:
+            word = mappings.get(field, {}).get(form)
+            if word:
+                return word
+    return generate_word(f"{role}::{lemma}")
+
+
+def _lexical_phrase(phrase: str, plural: bool = False) -> List[str]:
+    words = [
+        lexical_token(" ".join(chunk))
+        for chunk, _ in phrase_matcher().segment(phrase.split())
+        if len(chunk) > 1 or chunk[0].lower() not in _LEXICAL_SKIP
+    ]
+    if words and plural:
+        words[-1] = pluralize(words[-1])
+    return words
+
+
+def lexical_sentence(text: str) -> Tuple[str, ParsedSentence]:
+    """Token-by-token rendering of ``text`` in S-O-V-C order (without the context tail).
+
+    Subject and object tokens are translated as nouns (plural marking on the
+    head word), the verb carries the tense marker, and the context phrase keeps
+    its place at the end. Known multiword expressions (see ``phrase_matcher``)
+    become a single word.
+    """
+    ps = to_zyntalic_order(text)
+    words = _lexical_phrase(ps.subject, ps.subj_plural) + _lexical_phrase(ps.obj, ps.obj_plural)
+    if ps.verb:
+        words.append(mark_tense(lexical_token(ps.verb, "verb"), ps.tense))
+    words += _lexical_phrase(ps.context)
+    return " ".join(words), ps
+
+
 # -------------------- Embeddings --------------------
+# Working precision of the ndarray pipeline. float64 reproduces the list-based
+# values bit for bit; float32 halves memory traffic for bulk builds.
+EMBEDDING_DTYPES = ("float64", "float32")
+_EMBEDDING_DTYPE = "float64"
+
+
+def set_embedding_dtype(dtype: str) -> None:
+    """Select the embedding pipeline precision ("float64" or "float32")."""
+    global _EMBEDDING_DTYPE
+    dtype = str(dtype).strip().lower()
+    if dtype not in EMBEDDING_DTYPES:
+        raise ValueError(f"unknown embedding dtype {dtype!r}; expected one of {EMBEDDING_DTYPES}")
+    _EMBEDDING_DTYPE = dtype
+
+
+def get_embedding_dtype() -> str:
+    return _EMBEDDING_DTYPE
+
+
+_env_dtype = (os.environ.get("ZYNTALIC_EMBEDDING_DTYPE") or "").strip().lower()
+if _env_dtype in EMBEDDING_DTYPES:
+    _EMBEDDING_DTYPE = _env_dtype
+
+
 def base_embedding(key: str, dim: int = 300):
     if embed_text is not None:
         return embed_text(key, dim=dim)
@@ -444,33 +800,119 @@ def base_embedding(key: str, dim: int = 300):
     return [rng.random() for _ in range(dim)]
 
 
+def _base_matrix(keys: List[str], dim: int, dtype):
+    """Base embeddings of ``keys`` stacked into an (N, dim) array."""
+    if embed_text_array is not None:
+        rows = [embed_text_array(k, dim=dim) for k in keys]
+    else:
+        rows = [base_embedding(k, dim) for k in keys]
+    return np.array(rows, dtype=dtype)
+
+
+def _normalize_rows(V):
+    """Row-wise ``_normalize`` for a 2-D array.
+
+    In float64 the norms are reduced with Python's ``sum`` over the squared
+    entries so rows come out bit-identical to ``_normalize`` on the equivalent
+    list; float32 makes no such promise and reduces with ``einsum``.
+    """
+    if V.dtype != np.float64:
+        norms = np.sqrt(np.einsum("ij,ij->i", V, V))
+        norms[norms == 0] = 1.0
+        return V / norms[:, None]
+    norms = np.array([sum(r) ** 0.5 or 1.0 for r in (V * V).tolist()], dtype=V.dtype)
+    return V / norms[:, None]
 
-_ANCHOR_VECS_CACHE: Optional[Dict[str, List[float]]] = None
 
+# Anchor resources are keyed by embedding backend and dimension so switching the
+# pseudo-embedding version, or asking for another dim, never reuses stale anchors.
 def _get_anchor_vecs(dim: int = 300) -> Dict[str, List[float]]:
-    global _ANCHOR_VECS_CACHE
-    if _ANCHOR_VECS_CACHE is not None:
-        return _ANCHOR_VECS_CACHE
-    
-    vecs = {}
-    for name in ANCHORS:
-        label = name.replace("_", " ")
-        vecs[name] = _normalize(base_embedding(label, dim))
-    _ANCHOR_VECS_CACHE = vecs
-    return _ANCHOR_VECS_CACHE
+    def build():
+        vecs = {}
+        for name in ANCHORS:
+            label = name.replace("_", " ")
+            vecs[name] = _normalize(base_embedding(label, dim))
+        return vecs
 
+    return _RESOURCES.get(("anchor_vecs", embedding_backend(), dim), build)
 
-def anchor_weights_for_vec(vec: List[float], top_k: int = 3):
-    v = _normalize(vec)
-    scores = []
-    
-    # Use lazy getter
-    anchor_vecs = _get_anchor_vecs(len(v))
-    
-    for a, av in anchor_vecs.items():
-        scores.append((a, _dot(v, _normalize(av))))
-    scores.sort(key=lambda x: x[1], reverse=True)
-    top = scores[:top_k]
+
+# Scores within this distance of the k-th best are rescored exactly so that
+# float drift between NumPy and pure-Python dot products never changes ranking.
+_ANCHOR_SCORE_EPS = 1e-9
+
+
+class _AnchorIndex:
+    """Anchor set in the layouts the scoring and mixing paths need.
+
+    ``rows`` are the anchors normalized for scoring (pure-Python path), ``mat``
+    the same as a float64 matrix (``mat32`` in float32) and ``vecs`` the mixing
+    vectors (the output of ``_get_anchor_vecs``) as a matrix. The matrices are
+    ``None`` without NumPy.
+    """
+
+    __slots__ = ("names", "pos", "rows", "mat", "mat32", "vecs")
+
+    def __init__(self, anchor_vecs: Dict[str, List[float]]):
+        self.names = list(anchor_vecs.keys())
+        self.pos = {name: i for i, name in enumerate(self.names)}
+        self.rows = [_normalize(anchor_vecs[a]) for a in self.names]
+        if np is not None and self.rows:
+            self.mat = np.asarray(self.rows, dtype=np.float64)
+            self.mat32 = self.mat.astype(np.float32)
+            self.vecs = np.asarray([anchor_vecs[a] for a in self.names], dtype=np.float64)
+        else:
+            self.mat = self.mat32 = self.vecs = None
+
+
+def _get_anchor_index(dim: int = 300) -> _AnchorIndex:
+    return _RESOURCES.get(("anchor_index", embedding_backend(), dim), lambda: _AnchorIndex(_get_anchor_vecs(dim)))
+
+
+def _top_anchor_scores_many(vs, top_k: int) -> List[List[Tuple[str, float]]]:
+    """Top-k (anchor, cosine) pairs for each already-normalized vector.
+
+    ``vs`` is a 2-D array when NumPy is available (lists otherwise). In float64
+    one matrix product plus ``partition`` shortlists candidates and only the
+    shortlist is rescored with an exact Python sum, so scores match the
+    pure-Python path. In float32 the top-k is read straight off the product.
+    """
+    if len(vs) == 0:
+        return []
+    index = _get_anchor_index(len(vs[0]))
+    names = index.names
+
+    out = []
+    if index.mat is None:
+        for v in vs:
+            scores = [(name, _dot(v, row)) for name, row in zip(names, index.rows)]
+            scores.sort(key=lambda x: x[1], reverse=True)
+            out.append(scores[:top_k])
+        return out
+
+    if vs.dtype != np.float64:
+        sims = vs @ index.mat32.T
+        order = np.argsort(-sims, axis=1, kind="stable")[:, :top_k]
+        scores = np.take_along_axis(sims, order, axis=1).tolist()
+        return [[(names[i], s) for i, s in zip(row, srow)] for row, srow in zip(order.tolist(), scores)]
+
+    if 0 < top_k < len(names):
+        sims = vs @ index.mat.T
+        kth = np.partition(sims, -top_k, axis=1)[:, -top_k]
+        mask = sims >= (kth - _ANCHOR_SCORE_EPS)[:, None]
+        shortlists = [np.flatnonzero(row).tolist() for row in mask]
+    else:
+        shortlists = [list(range(len(names)))] * len(vs)
+
+    for v, candidates in zip(vs, shortlists):
+        prods = (v * index.mat[candidates]).tolist()
+        scores = [(names[i], sum(p)) for i, p in zip(candidates, prods)]
+        scores.sort(key=lambda x: x[1], reverse=True)
+        out.append(scores[:top_k])
+    return out
+
+
+def _softmax_top(top: List[Tuple[str, float]]) -> List[Tuple[str, float]]:
     m = max(s for _, s in top) if top else 0.0
     exps = [math.exp(s - m) for _, s in top]
     Z = sum(exps) or 1.0
@@ -478,6 +920,29 @@ def anchor_weights_for_vec(vec: List[float], top_k: int = 3):
     return [(name, w) for (name, _), w in zip(top, weights)]
 
 
+def _anchor_weights_rows(V, top_k: int = 3):
+    """``anchor_weights_for_vecs`` for a 2-D array, skipping the list conversion."""
+    return [_softmax_top(top) for top in _top_anchor_scores_many(_normalize_rows(V), top_k)]
+
+
+def anchor_weights_for_vecs(vecs, top_k: int = 3):
+    """Batched ``anchor_weights_for_vec``: scores every row against the anchors at once.
+
+    ``vecs`` may be a sequence of lists or a 2-D array.
+    """
+    if np is not None:
+        V = np.asarray(vecs, dtype=np.float64)
+        if V.ndim != 2 or not len(V):
+            return []
+        return _anchor_weights_rows(V, top_k)
+    tops = _top_anchor_scores_many([_normalize(v) for v in vecs], top_k)
+    return [_softmax_top(top) for top in tops]
+
+
+def anchor_weights_for_vec(vec, top_k: int = 3):
+    return anchor_weights_for_vecs([vec], top_k=top_k)[0]
+
+
 def load_projection(path: str = "models/W.npy"):
     if np is None:
         return None
@@ -491,53 +956,151 @@ def load_projection(path: str = "models/W.npy"):
 
 def get_projection(path: str = "models/W.npy"):
     """Load and memoize projection matrix so repeated translations avoid disk I/O."""
-    global _PROJECTION_CACHE
-    if _PROJECTION_CACHE is not _PROJECTION_CACHE_SENTINEL:
-        return _PROJECTION_CACHE
-    _PROJECTION_CACHE = load_projection(path)
-    return _PROJECTION_CACHE
+    return _RESOURCES.get(("projection", path), lambda: load_projection(path))
+
+
+# (projection fingerprint, dtype) -> W cast to that dtype
+_PROJECTION_CASTS = LRUCache(8)
+
+
+def _projection_as(W, dtype):
+    """``W`` in the pipeline dtype, cast once per matrix rather than per call."""
+    W = np.asarray(W)
+    if W.dtype == dtype:
+        return W
+    return _PROJECTION_CASTS.get_or_create((projection_fingerprint(W), dtype.str), lambda: W.astype(dtype))
+
+
+def _project_rows(B, W):
+    """``B @ W`` computed one row at a time.
+
+    A batched GEMM picks its blocking (and so its rounding) from the number of
+    rows, so a row's projection would depend on which batch it landed in. A
+    vector-matrix product per row gives the same bits for a seed whether it is
+    projected alone, in a serial block or on a worker.
+    """
+    out = np.empty((B.shape[0], W.shape[1]), dtype=np.result_type(B, W))
+    for i in range(B.shape[0]):
+        np.dot(B[i], W, out=out[i])
+    return out
 
 
 def apply_projection(vec: List[float], W) -> List[float]:
     if np is None or W is None:
         return vec
-    v = np.asarray(vec).reshape(1, -1) @ W
-    v = v.flatten().tolist()
-    return _normalize(v)
+    v = _project_rows(np.asarray(vec, dtype=np.float64).reshape(1, -1), np.asarray(W, dtype=np.float64))
+    return _normalize_rows(v)[0].tolist()
 
 
-def generate_embedding(seed_key: str, dim: int = 300, W=None):
-    vb = base_embedding(seed_key, dim)
-    canon = apply_projection(vb, W)
-    if canon == vb and W is None:
-        # no projection: softly mix with anchors
-        aw0 = anchor_weights_for_vec(vb, top_k=3)
-        
-        anchor_vecs = _get_anchor_vecs()
-        vecs = [vb] + [anchor_vecs[a] for a, _ in aw0]
-        
-        ws = [0.5] + [0.5 * w for _, w in aw0]
-        canon = _normalize(_mix(vecs, ws))
-    aw = anchor_weights_for_vec(canon, top_k=3)
-    return canon, aw
+def _mix_with_anchors(vb: List[float], aw0) -> List[float]:
+    """Softly pull an unprojected embedding toward its top anchors."""
+    anchor_vecs = _get_anchor_vecs(len(vb))
+    vecs = [vb] + [anchor_vecs[a] for a, _ in aw0]
+    ws = [0.5] + [0.5 * w for _, w in aw0]
+    return _normalize(_mix(vecs, ws))
 
 
-# -------------------- Public API --------------------
-def generate_entry(seed_word: str, mirror_rate: float = 0.3, W=None) -> Dict:
+def _mix_with_anchors_rows(B, aw0s):
+    """Row-wise ``_mix_with_anchors``; accumulates in the same order as ``_mix``."""
+    index = _get_anchor_index(B.shape[1])
+    width = min(len(aw) for aw in aw0s)
+    idx = np.array([[index.pos[a] for a, _ in aw[:width]] for aw in aw0s], dtype=np.intp).reshape(len(B), width)
+    ws = np.array([[0.5 * w for _, w in aw[:width]] for aw in aw0s], dtype=B.dtype).reshape(len(B), width)
+    out = 0.5 * B
+    for j in range(width):
+        out += ws[:, j, None] * index.vecs[idx[:, j]].astype(B.dtype, copy=False)
+    return _normalize_rows(out)
+
+
+def generate_embedding(seed_key: str, dim: int = 300, W=None, as_array: bool = False):
+    """Canonical embedding and anchor weights for one seed.
+
+    A batch of one through ``generate_embeddings``; ``as_array=True`` returns the
+    vector as a NumPy array in the configured dtype instead of a list.
     """
-    Generate a full dictionary entry deterministically.
-    seed_word: The English input (e.g., 'Love') which seeds ALL randomness.
-    mirror_rate: Probability of using chiasmus templates (0.0-1.0).
-                 Lower values produce more Zyntalic vocabulary output.
+    embs, aws = generate_embeddings([seed_key], dim, W, as_array=as_array)
+    return embs[0], aws[0]
+
+
+def generate_embeddings(seed_keys: List[str], dim: int = 300, W=None, as_array: bool = False):
+    """Batched ``generate_embedding``.
+
+    The base embeddings are stacked into one matrix and stay an ndarray through
+    projection (row by row, see ``_project_rows``) or anchor mixing,
+    normalization and anchor scoring. The working dtype is
+    ``get_embedding_dtype()``. In float64 every value matches the historical
+    list-based computation, which means row norms and shortlisted anchor scores
+    still go through Python lists for exact sums; float32 stays vectorized
+    throughout. The rows become lists at the end unless ``as_array=True`` asks
+    for the (N, dim) array itself. Each row is identical to a per-key call, with
+    or without a projection, whatever the batch size.
     """
+    seed_keys = list(seed_keys)
+    if np is None:
+        return _generate_embeddings_lists(seed_keys, dim, W)
+    if not seed_keys:
+        return (np.empty((0, dim), dtype=np.dtype(_EMBEDDING_DTYPE)) if as_array else []), []
+    canon, aws = _embedding_pipeline(seed_keys, dim, W)
+    return (canon if as_array else canon.tolist()), aws
+
+
+def generate_anchor_weights(seed_keys: List[str], dim: int = 300, W=None) -> List[List[Tuple[str, float]]]:
+    """Just the anchor weights of ``generate_embeddings(seed_keys, dim, W)``.
+
+    For callers that never look at the vector (translation): the canonical
+    embedding is still computed, since the weights are scored against it, but
+    it is dropped as an ndarray instead of being converted and returned.
+    """
+    seed_keys = list(seed_keys)
+    if not seed_keys:
+        return []
+    if np is None:
+        return _generate_embeddings_lists(seed_keys, dim, W)[1]
+    return _embedding_pipeline(seed_keys, dim, W)[1]
+
+
+def anchor_weights_for_seed(seed_key: str, W=None) -> List[Tuple[str, float]]:
+    """Memoized anchor weights of ``generate_embedding(seed_key, W=W)`` (a fresh list per call)."""
+    key = (seed_key, projection_fingerprint(W), embedding_backend(), _EMBEDDING_DTYPE)
+    aw = _ANCHOR_MEMO.get(key)
+    if aw is None:
+        aw = tuple(generate_anchor_weights([seed_key], W=W)[0])
+        _ANCHOR_MEMO.put(key, aw)
+    return list(aw)
+
+
+def _embedding_pipeline(seed_keys: List[str], dim: int, W):
+    """(canonical rows as an ndarray, anchor weights) for a non-empty key list."""
+    dtype = np.dtype(_EMBEDDING_DTYPE)
+    B = _base_matrix(seed_keys, dim, dtype)
+    if W is None:
+        # no projection: softly mix with anchors
+        canon = _mix_with_anchors_rows(B, _anchor_weights_rows(B, top_k=3))
+    else:
+        canon = _normalize_rows(_project_rows(B, _projection_as(W, dtype)))
+    return canon, _anchor_weights_rows(canon, top_k=3)
+
+
+def _generate_embeddings_lists(seed_keys: List[str], dim: int, W):
+    """Pure-Python ``generate_embeddings`` for installs without NumPy (projection is ignored)."""
+    base = [base_embedding(k, dim) for k in seed_keys]
+    if W is None:
+        aw0s = anchor_weights_for_vecs(base, top_k=3)
+        canons = [_mix_with_anchors(vb, aw0) for vb, aw0 in zip(base, aw0s)]
+    else:
+        canons = base
+    return canons, anchor_weights_for_vecs(canons, top_k=3)
+
+
+# -------------------- Public API --------------------
+def _assemble_entry(seed_word: str, mirror_rate: float, emb, aw) -> Dict:
     rng = get_rng(seed_word)
 
     # 1. Zyntalic Token (deterministic)
     w = generate_word(seed_word)
     pos_hint = "noun" if any(c in w for c in CHOSEONG) else "verb"
 
-    # 2. Embedding & Anchors (seeded by the same key)
-    emb, aw = generate_embedding(seed_word, W=W)
+    # 2. Anchors (from the embedding seeded by the same key)
     chosen = [name for name, _ in aw]
     weights = [wgt for _, wgt in aw]
 
@@ -556,9 +1119,81 @@ def generate_entry(seed_word: str, mirror_rate: float = 0.3, W=None) -> Dict:
         "sentence": sentence,
         "anchors": aw,
         "embedding": emb,
+        "embedding_backend": embedding_backend(),
     }
 
 
+def generate_entry(
+    seed_word: str,
+    mirror_rate: float = 0.3,
+    W=None,
+    as_array: bool = False,
+    with_embedding: bool = True,
+) -> Dict:
+    """
+    Generate a full dictionary entry deterministically.
+    seed_word: The English input (e.g., 'Love') which seeds ALL randomness.
+    mirror_rate: Probability of using chiasmus templates (0.0-1.0).
+                 Lower values produce more Zyntalic vocabulary output.
+    as_array: Return the embedding as a read-only NumPy array (in the dtype set
+              by ``set_embedding_dtype``) instead of a list. Needs NumPy.
+    with_embedding: When False, ``embedding`` is None and only the anchor
+              weights are computed (see ``anchor_weights_for_seed``); the rest
+              of the entry is identical.
+
+    Results are memoized per (seed_word, mirror_rate, projection fingerprint,
+    embedding backend, embedding dtype); callers get their own copy of the
+    list fields. A memoized entry built without its embedding gets it filled
+    in on first request.
+    """
+    key = (seed_word, float(mirror_rate), projection_fingerprint(W), embedding_backend(), _EMBEDDING_DTYPE)
+    entry = _ENTRY_MEMO.get(key)
+    if entry is None:
+        if with_embedding:
+            emb, aw = _entry_embedding(seed_word, W)
+        else:
+            emb, aw = None, anchor_weights_for_seed(seed_word, W=W)
+        entry = _assemble_entry(seed_word, mirror_rate, emb, aw)
+        # memoized fields are immutable (tuple anchors, read-only array) and copied out
+        entry["anchors"] = tuple(entry["anchors"])
+        _ENTRY_MEMO.put(key, entry)
+    elif with_embedding and entry["embedding"] is None:
+        entry = dict(entry, embedding=_entry_embedding(seed_word, W)[0])
+        _ENTRY_MEMO.put(key, entry)
+
+    emb = entry["embedding"]
+    if not with_embedding:
+        emb = None
+    elif np is None:
+        emb = list(emb)
+    elif not as_array:
+        emb = emb.tolist()
+    return dict(entry, anchors=list(entry["anchors"]), embedding=emb)
+
+
+def _entry_embedding(seed_word: str, W):
+    """Embedding (read-only array when NumPy is present) and anchor weights for one seed."""
+    emb, aw = generate_embedding(seed_word, W=W, as_array=np is not None)
+    if np is not None:
+        emb.flags.writeable = False
+    _ANCHOR_MEMO.put((seed_word, projection_fingerprint(W), embedding_backend(), _EMBEDDING_DTYPE), tuple(aw))
+    return emb, aw
+
+
+def generate_entries(seeds: List[str], mirror_rate: float = 0.3, W=None, as_array: bool = False) -> List[Dict]:
+    """
+    Generate dictionary entries for many seeds at once.
+
+    Equivalent to ``[generate_entry(s, mirror_rate, W, as_array) for s in seeds]``
+    but the embedding stage is batched (see ``generate_embeddings``), which is
+    what dominates bulk lexicon builds. With ``as_array=True`` each embedding is
+    a row view of one (N, dim) array.
+    """
+    seeds = list(seeds)
+    embs, aws = generate_embeddings(seeds, W=W, as_array=as_array)
+    return [_assemble_entry(s, mirror_rate, emb, aw) for s, emb, aw in zip(seeds, embs, aws)]
+
+
 def export_to_txt(entries, filename="zyntalic_words.txt"):
     with open(filename, "w", encoding="utf-8") as f:
         for e in entries:
@@ -569,40 +1204,241 @@ def export_to_txt(entries, filename="zyntalic_words.txt"):
             )
 
 
+COLUMNAR_FORMAT = "zyntalic-columnar"
+COLUMNAR_VERSION = 1
+
+
+def _tsv_field(text: str) -> str:
+    return str(text).replace("\t", " ").replace("\r", " ").replace("\n", " ")
+
+
+def export_to_columnar(entries, dirname="zyntalic_words", chunk_size: int = 4096) -> None:
+    """
+    Write entries as a columnar lexicon directory:
+
+      meta.json           format/version, count, dim, anchor names, backends
+      text.tsv            word<TAB>meaning<TAB>sentence, one row per entry
+      anchor_ids.npy      int16 (count, k) indices into meta["anchors"], -1 = none
+      anchor_weights.npy  float32 (count, k)
+      embeddings.npy      float32 (count, dim)
+
+    Embeddings are streamed into the ``.npy`` in chunks, so a 1M-entry lexicon
+    never needs a second in-memory copy. Read it back with ``load_columnar``.
+    Every entry needs an embedding of the same length (entries built with
+    ``with_embedding=False`` have none); otherwise ValueError is raised before
+    anything is written.
+    """
+    if np is None:
+        raise RuntimeError("NumPy is required for columnar export")
+    entries = list(entries)
+    count = len(entries)
+    dim = None
+    for row, e in enumerate(entries):
+        emb = e.get("embedding")
+        if emb is None:
+            raise ValueError(
+                f"entry {row} ({e.get('word')!r}) has no embedding; build entries with with_embedding=True to export them"
+            )
+        if dim is None:
+            dim = len(emb)
+        elif len(emb) != dim:
+            raise ValueError(f"entry {row} has a {len(emb)}-dim embedding, expected {dim}")
+    dim = dim or 0
+    os.makedirs(dirname, exist_ok=True)
+    k = max((len(e["anchors"]) for e in entries), default=0)
+
+    anchor_names = list(ANCHORS)
+    anchor_index = {a: i for i, a in enumerate(anchor_names)}
+    anchor_ids = np.full((count, k), -1, dtype=np.int16)
+    anchor_weights = np.zeros((count, k), dtype=np.float32)
+    backends = []
+
+    with open(os.path.join(dirname, "text.tsv"), "w", encoding="utf-8") as f:
+        for row, e in enumerate(entries):
+            f.write(f"{_tsv_field(e['word'])}\t{_tsv_field(e['meaning'])}\t{_tsv_field(e['sentence'])}\n")
+            for col, (a, w) in enumerate(e["anchors"]):
+                if a not in anchor_index:
+                    anchor_index[a] = len(anchor_names)
+                    anchor_names.append(a)
+                anchor_ids[row, col] = anchor_index[a]
+                anchor_weights[row, col] = w
+            backend = e.get("embedding_backend")
+            if backend and backend not in backends:
+                backends.append(backend)
+
+    np.save(os.path.join(dirname, "anchor_ids.npy"), anchor_ids)
+    np.save(os.path.join(dirname, "anchor_weights.npy"), anchor_weights)
+    emb = np.lib.format.open_memmap(
+        os.path.join(dirname, "embeddings.npy"), mode="w+", dtype=np.float32, shape=(count, dim)
+    )
+    for start in range(0, count, chunk_size):
+        chunk = entries[start:start + chunk_size]
+        emb[start:start + len(chunk)] = np.asarray([e["embedding"] for e in chunk], dtype=np.float32)
+    emb.flush()
+    del emb
+
+    meta = {
+        "format": COLUMNAR_FORMAT,
+        "version": COLUMNAR_VERSION,
+        "count": count,
+        "dim": dim,
+        "anchors": anchor_names,
+        "embedding_backends": backends,
+    }
+    with open(os.path.join(dirname, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+
+
+def load_columnar(dirname="zyntalic_words", mmap: bool = True) -> Dict:
+    """
+    Load a directory written by ``export_to_columnar``.
+
+    Returns a dict of columns: ``word``, ``meaning``, ``sentence`` (lists),
+    ``anchor_names`` (list), ``anchor_ids``/``anchor_weights``/``embeddings``
+    (arrays) and ``meta``. With ``mmap=True`` the arrays are read-only memory
+    maps, so embeddings are not copied into RAM until touched.
+    """
+    if np is None:
+        raise RuntimeError("NumPy is required to load a columnar lexicon")
+    with open(os.path.join(dirname, "meta.json"), "r", encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta.get("format") != COLUMNAR_FORMAT or meta.get("version") != COLUMNAR_VERSION:
+        raise ValueError(f"{dirname} is not a {COLUMNAR_FORMAT} v{COLUMNAR_VERSION} directory")
+
+    words, meanings, sentences = [], [], []
+    with open(os.path.join(dirname, "text.tsv"), "r", encoding="utf-8") as f:
+        for line in f:
+            w, m, snt = line.rstrip("\n").split("\t")
+            words.append(w)
+            meanings.append(m)
+            sentences.append(snt)
+
+    mode = "r" if mmap else None
+    return {
+        "meta": meta,
+        "word": words,
+        "meaning": meanings,
+        "sentence": sentences,
+        "anchor_names": meta["anchors"],
+        "anchor_ids": np.load(os.path.join(dirname, "anchor_ids.npy"), mmap_mode=mode),
+        "anchor_weights": np.load(os.path.join(dirname, "anchor_weights.npy"), mmap_mode=mode),
+        "embeddings": np.load(os.path.join(dirname, "embeddings.npy"), mmap_mode=mode),
+    }
+
+
+# Upper bound on seeds handed to generate_entries per batch in generate_words.
+_BULK_BLOCK_SIZE = 4096
+# Seeds per task when generate_words runs on a process pool.
+_PARALLEL_BLOCK_SIZE = 1024
+
+_WORKER_W = None
+
+
+def _init_generate_worker(W, pseudo_version: Optional[str], embedding_dtype: str = "float64") -> None:
+    global _WORKER_W
+    _WORKER_W = W
+    set_embedding_dtype(embedding_dtype)
+    if pseudo_version is not None:
+        # spawn-started workers don't inherit runtime selections from the parent
+        from .embeddings import set_pseudo_embedding_version
+
+        set_pseudo_embedding_version(pseudo_version)
+
+
+def _generate_block(root_seed: str, start: int, stop: int) -> List[Dict]:
+    return generate_entries([f"{root_seed}:{j}" for j in range(start, stop)], W=_WORKER_W)
+
+
+def _iter_blocks_parallel(root_seed: str, limit: int, W, workers: int, block_size: int):
+    """Yield entry blocks for seed indices [0, limit) in order, computed on a process pool.
+
+    At most ``2 * workers`` blocks are in flight; abandoning the generator cancels
+    whatever has not started yet.
+    """
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+
+    try:
+        from .embeddings import get_pseudo_embedding_version
+
+        pseudo_version = get_pseudo_embedding_version()
+    except Exception:  # pragma: no cover - embeddings module unavailable
+        pseudo_version = None
+
+    starts = iter(range(0, limit, block_size))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_generate_worker,
+        initargs=(W, pseudo_version, _EMBEDDING_DTYPE),
+    ) as pool:
+        pending = deque()
+        try:
+            for start in starts:
+                pending.append(pool.submit(_generate_block, root_seed, start, min(limit, start + block_size)))
+                if len(pending) >= 2 * workers:
+                    break
+            while pending:
+                block = pending.popleft().result()
+                start = next(starts, None)
+                if start is not None:
+                    pending.append(pool.submit(_generate_block, root_seed, start, min(limit, start + block_size)))
+                yield block
+        finally:
+            for fut in pending:
+                fut.cancel()
+
+
 def generate_words(
     n: int = 1000,
     use_projection: bool = True,
     root_seed: str = "zyntalic_default",
+    workers: int = 1,
+    block_size: int = _PARALLEL_BLOCK_SIZE,
 ):
     """
     Deterministic bulk generator.
     - Same (n, use_projection, root_seed) -> same wordlist every run.
     - Different root_seed -> different stable lexicon.
+    - workers > 1 shards the seed stream across a process pool in blocks of
+      ``block_size``; blocks are merged in seed order with the same
+      first-occurrence dedupe, so the output is identical for any worker count.
     """
     W = load_projection("models/W.npy") if use_projection else None
     out = []
     seen = set()
+    limit = n * 10 + 1  # safety: never look past seed index n * 10
+    if n <= 0:
+        return out
+
+    if workers and workers > 1:
+        blocks = _iter_blocks_parallel(root_seed, limit, W, workers, max(1, int(block_size)))
+        try:
+            for block in blocks:
+                for e in block:
+                    if e["word"] not in seen:
+                        seen.add(e["word"])
+                        out.append(e)
+                        if len(out) >= n:
+                            return out
+        finally:
+            blocks.close()
+        return out
+
     i = 0
-    while len(out) < n:
-        seed = f"{root_seed}:{i}"
-        e = generate_entry(seed, W=W)
-        if e["word"] not in seen:
-            seen.add(e["word"])
-            out.append(e)
-        i += 1
-        if i > n * 10:  # safety
-            break
+    while len(out) < n and i < limit:
+        stop = min(limit, i + min(n - len(out), _BULK_BLOCK_SIZE))
+        for e in generate_entries([f"{root_seed}:{j}" for j in range(i, stop)], W=W):
+            if e["word"] not in seen:
+                seen.add(e["word"])
+                out.append(e)
+        i = stop
     return out
 
 
 def generate_words_demo(n=10):
     """Generate n sample words using integer seeds for consistency."""
-    results = []
     W = load_projection()
-    for i in range(n):
-        seed = f"concept_{i}"
-        results.append(generate_entry(seed, W=W))
-    return results
+    return generate_entries([f"concept_{i}" for i in range(n)], W=W)
 
 
 if __name__ == "__main__":
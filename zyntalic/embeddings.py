@@ -2,33 +2,88 @@
 """
 Embedding backend for Zyntalic.
 
-- If `sentence-transformers` is installed, we use a small model.
+- If `sentence-transformers` is installed, we use a small model (the shared
+  one from `zyntalic.models`, also used by the transformer engine).
 - Otherwise we fall back to deterministic hash-based pseudo-embeddings.
 
 This keeps the repo runnable in offline/minimal environments while still allowing
 a better backend when you want it.
+
+Pseudo-embeddings are versioned so stored outputs stay reproducible:
+- "v1" (default): one `random.Random` draw per dimension.
+- "v2": one float32 fill from a seeded NumPy generator; much faster, but
+  different numbers. Select it per process with `set_pseudo_embedding_version`
+  or the ZYNTALIC_PSEUDO_EMBEDDING environment variable. `embedding_backend()`
+  names whatever is active so callers can record it next to their vectors.
+
+`embed_texts` embeds a batch in one model call. Model vectors are also kept in
+a content-addressed on-disk store (`zyntalic.utils.embedding_store`), so a text
+is encoded at most once per backend and dim across restarts.
 """
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import List, Optional, Sequence
 import hashlib
+import os
 import random
 
-_MODEL = None
-_DIM: Optional[int] = None
+try:  # pragma: no cover - optional
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover - optional
+    np = None
+
+from zyntalic import models
+
+MODEL_NAME = models.DEFAULT_MODEL_NAME
+PSEUDO_EMBEDDING_VERSIONS = ("v1", "v2")
+
+_PSEUDO_VERSION = "v1"
+
+
+def set_pseudo_embedding_version(version: str) -> None:
+    """Select the pseudo-embedding generator for this process ("v1" or "v2")."""
+    global _PSEUDO_VERSION
+    if version not in PSEUDO_EMBEDDING_VERSIONS:
+        raise ValueError(f"unknown pseudo-embedding version {version!r}; expected one of {PSEUDO_EMBEDDING_VERSIONS}")
+    _PSEUDO_VERSION = version
 
-def _lazy_load_model() -> None:
-    global _MODEL, _DIM
-    if _MODEL is not None:
-        return
-    try:
-        from sentence_transformers import SentenceTransformer  # type: ignore
-        _MODEL = SentenceTransformer("all-MiniLM-L6-v2")
-        _DIM = int(_MODEL.get_sentence_embedding_dimension())
-    except Exception:
-        _MODEL = None
-        _DIM = None
+
+def get_pseudo_embedding_version() -> str:
+    """Effective pseudo-embedding version ("v2" needs NumPy, else "v1" is used)."""
+    if _PSEUDO_VERSION == "v2" and np is None:
+        return "v1"
+    return _PSEUDO_VERSION
+
+
+def embedding_backend() -> str:
+    """Identifier of the backend `embed_text` uses, e.g. "pseudo-v1"."""
+    mid = models.model_id()
+    if mid is not None:
+        return mid
+    return f"pseudo-{get_pseudo_embedding_version()}"
+
+
+def pseudo_embedding(seed: int, dim: int, version: Optional[str] = None) -> List[float]:
+    """Deterministic pseudo-embedding of length `dim` from an integer seed."""
+    version = version or get_pseudo_embedding_version()
+    if version == "v2" and np is not None:
+        return pseudo_embedding_array(seed, dim, version).tolist()
+    rng = random.Random(seed)
+    return [rng.random() for _ in range(dim)]
+
+
+def pseudo_embedding_array(seed: int, dim: int, version: Optional[str] = None):
+    """`pseudo_embedding` as a NumPy vector (float32 for v2, float64 for v1)."""
+    version = version or get_pseudo_embedding_version()
+    if version == "v2":
+        return np.random.default_rng(seed).random(dim, dtype=np.float32)
+    return np.array(pseudo_embedding(seed, dim, "v1"))
+
+
+def _text_seed(text: str) -> int:
+    data = (text or "").encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
 
 
 def embed_text(text: str, dim: int = 300) -> List[float]:
@@ -39,22 +94,97 @@ def embed_text(text: str, dim: int = 300) -> List[float]:
     deterministically trim/pad to `dim`. Otherwise we generate a stable
     pseudo-embedding using a hash-seeded RNG.
     """
-    _lazy_load_model()
+    model = models.get_model()
+    if model is not None:
+        try:
+            v = model.encode([text or ""], normalize_embeddings=True)[0].tolist()
+            # pad deterministically based on text
+            return _pad_model_vector(v, text, dim)
+        except Exception:
+            # fall through to hash embedding
+            pass
+
+    return pseudo_embedding(_text_seed(text), dim)
 
-    if _MODEL is not None:
+
+def _pad_model_vector(v: List[float], text: str, dim: int) -> List[float]:
+    if len(v) >= dim:
+        return v[:dim]
+    rng = random.Random(_text_seed(text))
+    return v + [rng.random() for _ in range(dim - len(v))]
+
+
+def _embed_batch(texts: List[str], dim: int) -> List[List[float]]:
+    model = models.get_model()
+    if model is not None and texts:
+        try:
+            vs = model.encode(texts, normalize_embeddings=True)
+            return [_pad_model_vector(list(v.tolist()), t, dim) for v, t in zip(vs, texts)]
+        except Exception:
+            # fall through to hash embedding
+            pass
+    return [pseudo_embedding(_text_seed(t), dim) for t in texts]
+
+
+def embed_texts(texts: Sequence[str], dim: int = 300, store="auto") -> List[List[float]]:
+    """
+    Batch `embed_text`: one vector per text, same values, one model call.
+
+    ``store`` is an `EmbeddingStore` to read from and write to, or None to skip
+    persistence. "auto" uses the shared store for the active backend when a
+    model is loaded; pseudo-embeddings are cheaper to recompute than to read
+    back (and v1 is float64, which the float32 store would round). Texts found
+    in the store are not re-encoded; repeated texts are encoded once.
+    """
+    texts = [t or "" for t in texts]
+    if store == "auto":
+        store = None
+        if models.get_model() is not None and np is not None:
+            from zyntalic.utils.embedding_store import get_store
+            store = get_store(embedding_backend(), dim)
+    if store is None:
+        unique = list(dict.fromkeys(texts))
+        by_text = dict(zip(unique, _embed_batch(unique, dim)))
+        return [list(by_text[t]) for t in texts]
+
+    if store.dim != dim or store.backend != embedding_backend():
+        raise ValueError(
+            f"embedding store holds {store.backend!r} dim {store.dim}, "
+            f"active backend is {embedding_backend()!r} dim {dim}"
+        )
+    found = store.get_many(texts)
+    missing = list(dict.fromkeys(t for t, v in zip(texts, found) if v is None))
+    if missing:
+        vecs = _embed_batch(missing, dim)
+        store.put_many(missing, vecs)
+        by_text = dict(zip(missing, store.get_many(missing)))
+        found = [by_text[t] if v is None else v for t, v in zip(texts, found)]
+    return [v.tolist() for v in found]
+
+
+def embed_text_array(text: str, dim: int = 300):
+    """
+    `embed_text` as a NumPy vector, without a round trip through Python lists.
+
+    Holds the same values as `embed_text(text, dim)`; the dtype is whatever the
+    backend produces (float32 for the model and pseudo-v2, float64 for pseudo-v1).
+    """
+    model = models.get_model()
+    if model is not None:
         try:
-            v = _MODEL.encode([text or ""], normalize_embeddings=True)[0].tolist()
+            v = np.asarray(model.encode([text or ""], normalize_embeddings=True)[0])
             if len(v) >= dim:
                 return v[:dim]
-            # pad deterministically based on text
-            seed = int(hashlib.blake2b((text or "").encode("utf-8"), digest_size=8).hexdigest(), 16)
-            rng = random.Random(seed)
-            return v + [rng.random() for _ in range(dim - len(v))]
+            rng = random.Random(_text_seed(text))
+            pad = np.array([rng.random() for _ in range(dim - len(v))])
+            return np.concatenate([v.astype(np.float64), pad])
         except Exception:
             # fall through to hash embedding
             pass
 
-    data = (text or "").encode("utf-8")
-    seed = int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
-    rng = random.Random(seed)
-    return [rng.random() for _ in range(dim)]
+    return pseudo_embedding_array(_text_seed(text), dim)
+
+
+_env_version = (os.environ.get("ZYNTALIC_PSEUDO_EMBEDDING") or "").strip().lower()
+if _env_version in PSEUDO_EMBEDDING_VERSIONS:
+    set_pseudo_embedding_version(_env_version)
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+Shared sentence-embedding model registry.
+
+`zyntalic.embeddings` and `zyntalic.transformers` both get their model from
+here, so a process holds one copy of it and pays the load once.
+
+- `get_model()` loads lazily on first use; a failed load is remembered and
+  returns None (callers fall back to pseudo-embeddings / core).
+- `warm_model()` is the single warm-up hook; call it at startup.
+- `memory_report()` lists what is loaded and roughly how much RAM it holds.
+- Backends are pluggable (`register_backend`). Besides "sentence-transformers"
+  there is "stub", a hash-seeded offline encoder for tests, and "none".
+  Select one with ZYNTALIC_MODEL_BACKEND, or inject a model with `set_model`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+try:  # pragma: no cover - optional
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover - optional
+    np = None
+
+DEFAULT_MODEL_NAME = "all-MiniLM-L6-v2"
+DEFAULT_BACKEND = "sentence-transformers"
+
+
+class StubModel:
+    """Offline stand-in for SentenceTransformer: hash-seeded float32 vectors.
+
+    Same text -> same vector, no downloads. ``calls`` and ``encoded`` record
+    the encode calls so tests can assert on batching and caching.
+    """
+
+    def __init__(self, dim: int = 384):
+        self.dim = int(dim)
+        self.calls = 0
+        self.encoded: List[str] = []
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self.dim
+
+    def _vec(self, text: str):
+        seed = int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "big")
+        return np.random.default_rng(seed).standard_normal(self.dim).astype(np.float32)
+
+    def encode(self, texts, normalize_embeddings: bool = False, **_):
+        self.calls += 1
+        single = isinstance(texts, str)
+        texts = [texts] if single else list(texts)
+        self.encoded.extend(texts)
+        m = np.stack([self._vec(t) for t in texts]) if texts else np.zeros((0, self.dim), dtype=np.float32)
+        if normalize_embeddings:
+            norms = np.linalg.norm(m, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            m = m / norms
+        return m[0] if single else m
+
+
+def _load_sentence_transformer(name: str):
+    from sentence_transformers import SentenceTransformer  # type: ignore
+    return SentenceTransformer(name)
+
+
+def _load_stub(name: str):
+    if np is None:
+        raise RuntimeError("the stub backend needs NumPy")
+    return StubModel()
+
+
+def _load_none(name: str):
+    return None
+
+
+_BACKENDS: Dict[str, Callable[[str], Any]] = {
+    "sentence-transformers": _load_sentence_transformer,
+    "stub": _load_stub,
+    "none": _load_none,
+}
+
+_LOCK = threading.Lock()
+# (model, model id) once resolved; None until the first get_model()
+_ACTIVE: Optional[tuple] = None
+_LOAD_ERROR: Optional[BaseException] = None
+
+
+def register_backend(name: str, loader: Callable[[str], Any]) -> None:
+    """Make ``loader(model_name) -> model`` selectable as backend ``name``."""
+    _BACKENDS[name] = loader
+
+
+def available_backends() -> List[str]:
+    return list(_BACKENDS)
+
+
+def backend_name() -> str:
+    return (os.environ.get("ZYNTALIC_MODEL_BACKEND") or DEFAULT_BACKEND).strip()
+
+
+def _resolve() -> tuple:
+    global _ACTIVE, _LOAD_ERROR
+    active = _ACTIVE
+    if active is not None:
+        return active
+    with _LOCK:
+        if _ACTIVE is None:
+            backend = backend_name()
+            model = None
+            try:
+                loader = _BACKENDS[backend]
+                model = loader(DEFAULT_MODEL_NAME)
+            except Exception as exc:
+                _LOAD_ERROR = exc
+            _ACTIVE = (model, f"{backend}/{DEFAULT_MODEL_NAME}" if model is not None else None)
+        return _ACTIVE
+
+
+def get_model():
+    """The shared model, loading it on first use; None if no backend could load."""
+    return _resolve()[0]
+
+
+def model_id() -> Optional[str]:
+    """"<backend>/<model name>" of the shared model (None when there is none)."""
+    return _resolve()[1]
+
+
+def set_model(model, name: Optional[str] = None) -> None:
+    """Use ``model`` (anything with a sentence-transformers style ``encode``) as
+    the shared model under id ``name``; ``set_model(None)`` drops it so the
+    next `get_model()` loads from the configured backend again.
+
+    The id keys downstream caches, so give distinct models distinct names.
+    """
+    global _ACTIVE, _LOAD_ERROR
+    with _LOCK:
+        _LOAD_ERROR = None
+        _ACTIVE = None if model is None else (model, name or f"custom/{type(model).__name__}")
+
+
+def warm_model() -> bool:
+    """Load the shared model now (instead of on the first request); True if one is available."""
+    return get_model() is not None
+
+
+def _model_bytes(model) -> Optional[int]:
+    params = getattr(model, "parameters", None)
+    if callable(params):
+        try:
+            return int(sum(p.numel() * p.element_size() for p in params()))
+        except Exception:
+            return None
+    nbytes = getattr(model, "nbytes", None)
+    return int(nbytes) if isinstance(nbytes, int) else None
+
+
+def memory_report() -> Dict[str, Any]:
+    """What the registry holds: backend, model id, parameter bytes (if measurable),
+    the last load error, and the process peak RSS where ``resource`` exists.
+    Does not trigger a load.
+    """
+    active = _ACTIVE
+    model, mid = active if active is not None else (None, None)
+    report: Dict[str, Any] = {
+        "backend": backend_name(),
+        "loaded": model is not None,
+        "model": mid,
+        "model_bytes": _model_bytes(model) if model is not None else 0,
+        "load_error": repr(_LOAD_ERROR) if _LOAD_ERROR is not None else None,
+    }
+    try:
+        import resource
+        import sys
+
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        report["peak_rss_bytes"] = rss if sys.platform == "darwin" else rss * 1024
+    except Exception:  # pragma: no cover - e.g. Windows
+        report["peak_rss_bytes"] = None
+    return report
@@ -2,37 +2,44 @@
 """
 Transformer-based engine for Zyntalic.
 Uses sentence-transformers to find the closest "Schelling point" in the anchor space.
+The model is the shared one from `zyntalic.models` (the same instance
+`zyntalic.embeddings` uses).
+
+Anchor names are embedded once per model: the normalized matrix is kept in memory
+and persisted under data/cache/anchor_embeddings/ (override the directory with
+ZYNTALIC_ANCHOR_CACHE_DIR; an empty value disables persistence), so requests
+only encode their own text.
 """
-from typing import List, Dict
+import os
+import re
+import threading
+from typing import List, Dict, Optional, Sequence
 import numpy as np
 
-try:
-    from sentence_transformers import SentenceTransformer
-except ImportError:
-    SentenceTransformer = None
+from . import core, models
+from .utils.paths import ROOT_DIR, env_path
+
+DEFAULT_ANCHOR_CACHE_DIR = os.path.join(ROOT_DIR, "data", "cache", "anchor_embeddings")
 
-_MODEL = None
+# (model name, anchors) -> (anchors, row-normalized float32 matrix)
+_ANCHOR_MATRIX: Dict[tuple, tuple] = {}
+_ANCHOR_LOCK = threading.Lock()
 
-from . import core
+MODEL_NAME = models.DEFAULT_MODEL_NAME
 
 def get_model():
-    global _MODEL, SentenceTransformer
-    
-    # Lazy import if not already imported (though we check module availability above)
-    if SentenceTransformer is None:
-        try:
-            from sentence_transformers import SentenceTransformer
-        except ImportError:
-            return None
-
-    if _MODEL is None:
-        try:
-            # resilient, lightweight model
-            _MODEL = SentenceTransformer('all-MiniLM-L6-v2')
-        except Exception:
-            _MODEL = None
-            
-    return _MODEL
+    """The shared embedding model (None without a usable backend)."""
+    return models.get_model()
+
+def set_model(model, name: Optional[str] = None) -> None:
+    """Use ``model`` (anything with a sentence-transformers style ``encode``) under ``name``.
+
+    Sets the shared model in `zyntalic.models`. ``name`` keys the anchor-matrix
+    cache, so give distinct models distinct names.
+    """
+    with _ANCHOR_LOCK:
+        models.set_model(model, name)
+        _ANCHOR_MATRIX.clear()
 
 def get_anchor_embeddings():
     """
@@ -59,37 +66,96 @@ def get_anchor_embeddings():
         
     return ["Homer_Iliad", "Plato_Republic"] # Minimal fallback
 
-def semantic_match(text: str, top_k: int = 3) -> List[str]:
+def _normalize_rows(m):
+    m = np.asarray(m, dtype=np.float32)
+    norms = np.linalg.norm(m, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return m / norms
+
+def anchor_cache_dir() -> Optional[str]:
+    return env_path("ZYNTALIC_ANCHOR_CACHE_DIR", DEFAULT_ANCHOR_CACHE_DIR)
+
+def _anchor_cache_file(model_name: str) -> Optional[str]:
+    directory = anchor_cache_dir()
+    if not directory:
+        return None
+    return os.path.join(directory, re.sub(r"[^A-Za-z0-9_.-]+", "_", model_name) + ".npz")
+
+def _load_anchor_matrix(path: str, anchors: Sequence[str]):
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            if data["anchors"].tolist() != list(anchors):
+                return None
+            return np.asarray(data["matrix"], dtype=np.float32)
+    except Exception:
+        return None
+
+def _save_anchor_matrix(path: str, anchors: Sequence[str], matrix) -> None:
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp.npz"
+        np.savez(tmp_path, anchors=np.array(list(anchors)), matrix=matrix)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # persistence is an optimization only
+
+def get_anchor_matrix(model=None):
+    """(anchors, row-normalized anchor embedding matrix) for the current model.
+
+    Encoded once per (model name, anchor set); later processes load it from the
+    on-disk cache instead of re-encoding.
     """
-    Find the top_k anchors that semantically match the input text.
+    model = model if model is not None else get_model()
+    model_name = models.model_id() or MODEL_NAME
+    anchors = tuple(get_anchor_embeddings())
+    key = (model_name, anchors)
+    hit = _ANCHOR_MATRIX.get(key)
+    if hit is not None:
+        return hit
+    with _ANCHOR_LOCK:
+        hit = _ANCHOR_MATRIX.get(key)
+        if hit is None:
+            path = _anchor_cache_file(model_name)
+            matrix = _load_anchor_matrix(path, anchors) if path else None
+            if matrix is None:
+                matrix = _normalize_rows(model.encode(list(anchors)))
+                if path:
+                    _save_anchor_matrix(path, anchors, matrix)
+            hit = _ANCHOR_MATRIX[key] = (list(anchors), matrix)
+    return hit
+
+def semantic_match_many(texts: Sequence[str], top_k: int = 3) -> List[List[str]]:
+    """
+    ``semantic_match`` for many texts: one ``encode`` call (one batched forward
+    pass) for all inputs, scored against the cached anchor matrix.
     """
+    texts = list(texts)
     model = get_model()
-    if model is None:
-        return []
+    if model is None or not texts:
+        return [[] for _ in texts]
 
-    anchors = get_anchor_embeddings()
+    anchors, matrix = get_anchor_matrix(model)
     if not anchors:
-        return []
+        return [[] for _ in texts]
 
-    # Encode input and anchors
-    # Check if we can cache anchor embeddings for performance
-    # For now, we compute on the fly (small list) or use cached
-    
-    # We will use a simple cache on the module level if this scales
-    # But for a few dozen anchors, it's fast.
-    
-    encoded_input = model.encode(text)
-    encoded_anchors = model.encode(anchors)
-    
-    # Cosine similarity
-    sims = np.dot(encoded_anchors, encoded_input) / (
-        np.linalg.norm(encoded_anchors, axis=1) * np.linalg.norm(encoded_input)
-    )
-    
-    # Get top k indices
-    top_indices = np.argsort(sims)[-top_k:][::-1]
-    
-    return [anchors[i] for i in top_indices]
+    encoded = np.asarray(model.encode(texts), dtype=np.float32).reshape(len(texts), -1)
+    norms = np.linalg.norm(encoded, axis=1)
+    norms[norms == 0] = 1.0
+    # Cosine similarity (anchor rows are already unit length)
+    sims = (encoded @ matrix.T) / norms[:, None]
+
+    out = []
+    for row in sims:
+        # Get top k indices
+        top_indices = np.argsort(row)[-top_k:][::-1]
+        out.append([anchors[i] for i in top_indices])
+    return out
+
+def semantic_match(text: str, top_k: int = 3) -> List[str]:
+    """
+    Find the top_k anchors that semantically match the input text.
+    """
+    return semantic_match_many([text], top_k=top_k)[0]
 
 def translate_transformer(text: str, mirror_rate: float = 0.8) -> str:
     """
@@ -97,8 +163,15 @@ def translate_transformer(text: str, mirror_rate: float = 0.8) -> str:
     Instead of random or heuristic anchors, we use the ones that match the *meaning* of the input.
     """
     # 1. Find semantic anchors
-    matched_anchors = semantic_match(text, top_k=2)
-    
+    return _render_transformer(text, semantic_match(text, top_k=2), mirror_rate)
+
+def translate_transformer_many(texts: Sequence[str], mirror_rate: float = 0.8) -> List[str]:
+    """``translate_transformer`` for many texts; all of them are encoded in one pass."""
+    texts = list(texts)
+    matches = semantic_match_many(texts, top_k=2)
+    return [_render_transformer(t, m, mirror_rate) for t, m in zip(texts, matches)]
+
+def _render_transformer(text: str, matched_anchors: List[str], mirror_rate: float) -> str:
     # 2. Assign weights (simple decay)
     weights = [0.7, 0.3] if len(matched_anchors) >= 2 else [1.0]
     
@@ -114,7 +187,7 @@ def translate_transformer(text: str, mirror_rate: float = 0.8) -> str:
     
     if not matched_anchors:
         # Fallback to core default
-        entry = core.generate_entry(text, mirror_rate=mirror_rate)
+        entry = core.generate_entry(text, mirror_rate=mirror_rate, with_embedding=False)
         return entry['sentence']
         
     sentence = core.plain_sentence_anchored(rng, matched_anchors, weights)
@@ -10,30 +10,37 @@ This wraps the deterministic core into a stable interface usable by:
 
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
 from dataclasses import asdict
+import codecs
+import os
 import re
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-from . import core
+from . import core, models
+from .utils.lru import LRUCache
+from .utils.registry import ResourceRegistry
+from .utils.paths import ROOT_DIR, env_path
+from .utils.snapshot import make_section, read_section, write_snapshot
 
 # Memoize projection to avoid repeated disk reads during translation hot path
 _PROJECTION_W = core.get_projection()
 
 
-def warm_translation_pipeline() -> None:
-    """Preload heavy resources (lexicons, mappings, anchor vecs, projection).
+def warm_translation_pipeline(engines: Iterable[str] = ("core",)) -> None:
+    """Create and warm the named engines (default: core, i.e. lexicons, mappings,
+    anchor vecs, projection and lemma table) so the first request is fast.
 
     Any failure is swallowed so server startup does not abort; translation will
     still function with fallback behavior.
     """
-    try:
-        core.load_lexicons()
-        core.load_vocabulary_mappings()
-        core._get_anchor_vecs()  # type: ignore  # intentionally using internal cache
-        # projection already memoized at import; ensure loaded if available
-        core.get_projection()
-    except Exception as exc:  # pragma: no cover - defensive guard
-        print(f"[warmup] Warning: preload skipped due to: {exc}")
+    for name in engines:
+        try:
+            engine = get_engine(name)
+            if engine is not None:
+                engine.warm()
+        except Exception as exc:  # pragma: no cover - defensive guard
+            print(f"[warmup] Warning: {name} preload skipped due to: {exc}")
 
 _SENT_SPLIT = re.compile(r"(?<=[.!?])\s+")
 
@@ -46,6 +53,300 @@ def _clean_lemma(text: str) -> str:
     return t.split()[0]
 
 
+# -------------------- Precomputed lemma table --------------------
+# Core output depends only on (lemma, mirror_rate, projection, embedding backend),
+# so the lexicon vocabulary can be translated ahead of time. The table is a
+# snapshot section (see utils.snapshot) tied to the lexicon and mapping files.
+LEMMA_TABLE_VERSION = 1
+DEFAULT_LEMMA_TABLE_PATH = os.path.join(ROOT_DIR, "data", "cache", "lemma_table.pkl")
+# translate_sentence and translate_text defaults
+DEFAULT_TABLE_MIRROR_RATES = (0.3, 0.8)
+
+
+def lemma_table_path() -> Optional[str]:
+    """Table location; ZYNTALIC_LEMMA_TABLE overrides it and an empty value disables it."""
+    return env_path("ZYNTALIC_LEMMA_TABLE", DEFAULT_LEMMA_TABLE_PATH)
+
+
+def _lemma_table_sources() -> List[str]:
+    _, paths = core._lexicon_sources()  # type: ignore  # same files load_lexicons reads
+    if not paths:
+        return []
+    mappings = core._vocab_mappings_source()  # type: ignore
+    return paths + ([mappings] if mappings else [])
+
+
+def _lemma_table_key(W) -> Tuple:
+    return (core.embedding_backend(), core.get_embedding_dtype(), core.projection_fingerprint(W))
+
+
+def table_lemmas() -> List[str]:
+    """Every lemma the lexicons and vocabulary mappings can produce, sorted."""
+    words = set()
+    for lex in core.load_lexicons().values():
+        for field in ("adjectives", "nouns", "verbs"):
+            words.update(w for w in lex.get(field, []) if isinstance(w, str))
+    for table in core.load_vocabulary_mappings().values():
+        words.update(w for w in table if isinstance(w, str))
+    lemmas = {_clean_lemma(w) for w in words}
+    lemmas.discard("")
+    return sorted(lemmas)
+
+
+def build_lemma_table(
+    path: Optional[str] = None,
+    mirror_rates: Iterable[float] = DEFAULT_TABLE_MIRROR_RATES,
+    lemmas: Optional[Iterable[str]] = None,
+) -> str:
+    """Precompute core translations of ``lemmas`` (default: ``table_lemmas()``).
+
+    Rows are computed with the default projection, exactly as
+    ``translate_sentence`` would, and stored per mirror rate as
+    ``lemma -> (target, anchors)``. Returns the table path.
+    """
+    path = path or lemma_table_path() or DEFAULT_LEMMA_TABLE_PATH
+    paths = _lemma_table_sources()
+    if not paths:
+        raise RuntimeError("lexicon sources are not plain files; nothing to tie a lemma table to")
+    lemmas = table_lemmas() if lemmas is None else sorted(set(lemmas))
+    rows = {}
+    for rate in mirror_rates:
+        rate = float(rate)
+        table = rows[rate] = {}
+        for lemma in lemmas:
+            e = core.generate_entry(lemma, mirror_rate=rate, W=_PROJECTION_W, with_embedding=False)
+            table[lemma] = (e["sentence"], tuple(e["anchors"]))
+    data = {"key": _lemma_table_key(_PROJECTION_W), "rows": rows}
+    section = make_section(f"lemma-table-v{LEMMA_TABLE_VERSION}", paths, data)
+    written = write_snapshot({"lemma_table": section}, path)
+    core.clear_resource_cache("lemma_table")
+    return written
+
+
+def _lemma_table() -> Optional[dict]:
+    """The lemma table if one exists and is fresh for the current sources, else None."""
+    path = lemma_table_path()
+    if not path:
+        return None
+
+    def build():
+        paths = _lemma_table_sources()
+        if not paths:
+            return None
+        return read_section("lemma_table", f"lemma-table-v{LEMMA_TABLE_VERSION}", paths, path)
+
+    return core._RESOURCES.get(("lemma_table", path), build)  # type: ignore
+
+
+def _lookup_lemma_table(seed: str, mirror_rate: float, W) -> Optional[Tuple[str, tuple]]:
+    table = _lemma_table()
+    if table is None:
+        return None
+    rows = table["rows"].get(float(mirror_rate))
+    if rows is None:
+        return None
+    hit = rows.get(seed)
+    if hit is None or table["key"] != _lemma_table_key(W):
+        return None
+    return hit
+
+
+# -------------------- Engine registry --------------------
+class Engine(ABC):
+    """A translation engine: created once per process, then shared across threads.
+
+    ``translate`` returns a full row and must not keep per-request state; it may
+    raise, in which case ``translate_sentence`` falls back to the core engine.
+    """
+
+    name = ""
+
+    def warm(self) -> None:
+        """Load whatever the first request would otherwise pay for."""
+
+    @abstractmethod
+    def translate(self, src: str, lemma: str, *, mirror_rate: float, W=None) -> Dict:
+        """The row for one sentence."""
+
+    def translate_many(self, srcs: List[str], lemmas: List[str], *, mirror_rate: float, W=None) -> List[Dict]:
+        """Rows for many sentences; override when the engine can batch its work."""
+        return [self.translate(src, lemma, mirror_rate=mirror_rate, W=W) for src, lemma in zip(srcs, lemmas)]
+
+
+class CoreEngine(Engine):
+    """Rule-based + anchor mixing, answered from the lemma table when possible."""
+
+    name = "core"
+
+    def warm(self) -> None:
+        core.load_lexicons()
+        core.load_vocabulary_mappings()
+        core._get_anchor_vecs()  # type: ignore  # intentionally using internal cache
+        core.get_projection()
+        _lemma_table()
+
+    def translate(self, src: str, lemma: str, *, mirror_rate: float, W=None) -> Dict:
+        W = W if W is not None else _PROJECTION_W
+        hit = _lookup_lemma_table(lemma or src, mirror_rate, W)
+        if hit is not None:
+            target, anchors = hit
+            return {
+                "source": src,
+                "target": target,
+                "lemma": lemma,
+                "anchors": list(anchors),
+                "engine": "core",
+            }
+
+        entry = core.generate_entry(lemma or src, mirror_rate=mirror_rate, W=W, with_embedding=False)
+        # entry contains 'sentence' (with ctx tail) and anchor weights; the vector is never returned
+        return {
+            "source": src,
+            "target": entry["sentence"],
+            "lemma": lemma,
+            "anchors": entry["anchors"],
+            "engine": "core",
+        }
+
+
+class TestSuiteEngine(Engine):
+    """Core translation tagged with test-suite validation metadata."""
+
+    name = "test_suite"
+    __test__ = False  # not a pytest class
+
+    def translate(self, src: str, lemma: str, *, mirror_rate: float, W=None) -> Dict:
+        entry = core.generate_entry(lemma or src, mirror_rate=mirror_rate, W=W, with_embedding=False)
+        return {
+            "source": src,
+            "target": entry["sentence"],
+            "lemma": lemma,
+            "anchors": entry["anchors"],
+            "engine": "test_suite",
+            "validation": "passed",
+            "test_info": "Input validated with test suite"
+        }
+
+
+class TransformerEngine(Engine):
+    """Semantic anchor matching via sentence-transformers."""
+
+    name = "transformer"
+
+    def __init__(self):
+        from . import transformers
+
+        self._module = transformers
+
+    def warm(self) -> None:
+        if models.warm_model():
+            self._module.get_anchor_matrix()
+
+    def translate(self, src: str, lemma: str, *, mirror_rate: float, W=None) -> Dict:
+        return self._row(src, lemma, self._module.translate_transformer(src, mirror_rate=mirror_rate))
+
+    def translate_many(self, srcs: List[str], lemmas: List[str], *, mirror_rate: float, W=None) -> List[Dict]:
+        # one encode call for the whole batch
+        targets = self._module.translate_transformer_many(srcs, mirror_rate=mirror_rate)
+        return [self._row(src, lemma, tgt) for src, lemma, tgt in zip(srcs, lemmas, targets)]
+
+    @staticmethod
+    def _row(src: str, lemma: str, target: str) -> Dict:
+        return {
+            "source": src,
+            "target": target,
+            "lemma": lemma,
+            "anchors": [], # TODO: populate if needed
+            "engine": "transformer",
+        }
+
+
+class LexicalEngine(Engine):
+    """Token-by-token translation in S-O-V-C order (literal; ignores mirror_rate).
+
+    Every token goes through the per-token memo in ``core.lexical_token``, so
+    cost grows with the vocabulary seen, not the number of sentences.
+    """
+
+    name = "lexical"
+
+    def warm(self) -> None:
+        core.load_vocabulary_mappings()
+        core._get_anchor_vecs()  # type: ignore  # intentionally using internal cache
+        core.get_projection()
+
+    def translate(self, src: str, lemma: str, *, mirror_rate: float, W=None) -> Dict:
+        W = W if W is not None else _PROJECTION_W
+        seed = lemma or src
+        body, _ = core.lexical_sentence(src)
+        anchors = core.anchor_weights_for_seed(seed, W=W)
+        ctx = core.make_context(seed, seed, [name for name, _ in anchors], "noun")
+        return {
+            "source": src,
+            "target": f"{body} {ctx}" if body else ctx,
+            "lemma": lemma,
+            "anchors": anchors,
+            "engine": "lexical",
+        }
+
+
+class ChiasmusEngine(Engine):
+    """Chiasmus renderer (more stylized)."""
+
+    name = "chiasmus"
+
+    def __init__(self):
+        from .chiasmus import translate_chiasmus  # type: ignore
+
+        self._translate = translate_chiasmus
+
+    def translate(self, src: str, lemma: str, *, mirror_rate: float, W=None) -> Dict:
+        return {
+            "source": src,
+            "target": self._translate(src),
+            "lemma": lemma,
+            "anchors": [],
+            "engine": "chiasmus",
+        }
+
+
+_ENGINE_FACTORIES: Dict[str, Callable[[], Engine]] = {
+    "core": CoreEngine,
+    "test_suite": TestSuiteEngine,
+    "transformer": TransformerEngine,
+    "chiasmus": ChiasmusEngine,
+    "lexical": LexicalEngine,
+}
+# name -> engine instance, or the exception its factory raised (not retried)
+_ENGINES = ResourceRegistry()
+
+
+def register_engine(name: str, factory: Callable[[], Engine]) -> None:
+    """Add or replace an engine; ``factory`` runs once, on first use or warm-up."""
+    _ENGINE_FACTORIES[name] = factory
+    _ENGINES.clear(name)
+
+
+def available_engines() -> List[str]:
+    return list(_ENGINE_FACTORIES)
+
+
+def get_engine(name: str) -> Optional[Engine]:
+    """The process-wide instance of engine ``name``; None if unknown or it failed to build."""
+    factory = _ENGINE_FACTORIES.get(name)
+    if factory is None:
+        return None
+
+    def build():
+        try:
+            return factory()
+        except Exception as exc:
+            return exc
+
+    engine = _ENGINES.get((name,), build)
+    return None if isinstance(engine, Exception) else engine
+
+
 def translate_sentence(
     text: str,
     *,
@@ -56,73 +357,114 @@ def translate_sentence(
     """
     Translate a single sentence to a structured record.
 
-    engine:
+    engine (see ``available_engines``; unknown or failing engines fall back to core):
       - "core": rule-based + anchor mixing (recommended baseline)
       - "chiasmus": uses chiasmus renderer if available (more stylized)
       - "transformer": uses semantic anchor matching via sentence-transformers
       - "test_suite": runs comprehensive validation and returns diagnostic info
+      - "lexical": token-by-token S-O-V-C translation with plural/tense marking
     """
     src = (text or "").strip()
     lemma = _clean_lemma(src)
 
-    if engine == "test_suite":
-        try:
-            from .test_suite import ZyntalicTestSuite
-            # Run a quick validation test for the input
-            test_suite = ZyntalicTestSuite()
-            # Use core engine for actual translation but add test metadata
-            entry = core.generate_entry(lemma or src, mirror_rate=mirror_rate, W=W)
-            return {
-                "source": src,
-                "target": entry["sentence"],
-                "lemma": lemma,
-                "anchors": entry["anchors"],
-                "engine": "test_suite",
-                "validation": "passed",
-                "test_info": "Input validated with test suite"
-            }
-        except Exception as e:
-            # Fall back to core if test suite fails
-            engine = "core"
+    if engine != "core":
+        impl = get_engine(engine)
+        if impl is not None:
+            try:
+                return impl.translate(src, lemma, mirror_rate=mirror_rate, W=W)
+            except Exception:
+                pass  # fall back to core
+
+    return get_engine("core").translate(src, lemma, mirror_rate=mirror_rate, W=W)
 
-    if engine == "transformer":
-        try:
-            from .transformers import translate_transformer
-            return {
-                "source": src,
-                "target": translate_transformer(src, mirror_rate=mirror_rate),
-                "lemma": lemma,
-                "anchors": [], # TODO: populate if needed
-                "engine": "transformer",
-            }
-        except Exception as e:
-            # print(f"Transformer error: {e}") # debug
-            engine = "core"
 
-    if engine == "chiasmus":
+def translate_sentences(
+    texts: Iterable[str],
+    *,
+    mirror_rate: float = 0.3,
+    engine: str = "core",
+    W=None,
+) -> List[Dict]:
+    """
+    ``[translate_sentence(t, ...) for t in texts]``, letting engines that can batch
+    (e.g. transformer: one encode call) do so. If the batched call fails, every
+    text goes through ``translate_sentence`` and its core fallback instead.
+    """
+    texts = list(texts)
+    impl = get_engine(engine) if engine != "core" and len(texts) > 1 else None
+    if impl is not None:
+        srcs = [(t or "").strip() for t in texts]
         try:
-            from .chiasmus import translate_chiasmus  # type: ignore
-            tgt = translate_chiasmus(src)
-            return {
-                "source": src,
-                "target": tgt,
-                "lemma": lemma,
-                "anchors": [],
-                "engine": "chiasmus",
-            }
+            return impl.translate_many(srcs, [_clean_lemma(src) for src in srcs], mirror_rate=mirror_rate, W=W)
         except Exception:
-            # fall back to core
-            engine = "core"
+            pass
+    return [translate_sentence(t, mirror_rate=mirror_rate, engine=engine, W=W) for t in texts]
+
+
+# Engines whose row depends only on the lemma (plus mirror_rate and W); the
+# others read the whole sentence, so only exact repeats can share a result.
+_LEMMA_KEYED_ENGINES = frozenset({"core", "test_suite"})
+
+
+def _document_memo_key(src: str, engine: str) -> Tuple[str, str]:
+    lemma = _clean_lemma(src)
+    if lemma and engine in _LEMMA_KEYED_ENGINES:
+        return ("lemma", lemma)
+    return ("source", src)
+
+
+# translate_text(workers > 1) stays serial below this many distinct sentences;
+# pool start-up and warm-up would cost more than they save.
+_PARALLEL_MIN_SENTENCES = 512
+_PARALLEL_CHUNK_SIZE = 256
+
+_WORKER_W = None
+
+
+def _init_translate_worker(W, pseudo_version: Optional[str], embedding_dtype: str, engine: str) -> None:
+    global _WORKER_W
+    _WORKER_W = W
+    # spawn-started workers don't inherit runtime selections from the parent
+    if pseudo_version is not None:
+        from .embeddings import set_pseudo_embedding_version
 
-    entry = core.generate_entry(lemma or src, mirror_rate=mirror_rate, W=W or _PROJECTION_W)
-    # entry contains 'sentence' (with ctx tail) and anchor weights
-    return {
-        "source": src,
-        "target": entry["sentence"],
-        "lemma": lemma,
-        "anchors": entry["anchors"],
-        "engine": "core",
-    }
+        set_pseudo_embedding_version(pseudo_version)
+    core.set_embedding_dtype(embedding_dtype)
+    warm_translation_pipeline(engines=("core", engine))
+
+
+def _translate_chunk(parts: List[str], mirror_rate: float, engine: str, W) -> List[Dict]:
+    return translate_sentences(parts, mirror_rate=mirror_rate, engine=engine, W=W)
+
+
+def _translate_worker_chunk(parts: List[str], mirror_rate: float, engine: str) -> List[Dict]:
+    return _translate_chunk(parts, mirror_rate, engine, _WORKER_W)
+
+
+def _translate_parallel(parts: List[str], mirror_rate: float, engine: str, W, workers: int, chunk_size: int):
+    """``_translate_chunk`` over ``parts`` on a warmed process pool; rows in input order."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    try:
+        from .embeddings import get_pseudo_embedding_version
+
+        pseudo_version = get_pseudo_embedding_version()
+    except Exception:  # pragma: no cover - embeddings module unavailable
+        pseudo_version = None
+
+    chunks = [parts[i:i + chunk_size] for i in range(0, len(parts), chunk_size)]
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(chunks)),
+        initializer=_init_translate_worker,
+        initargs=(W, pseudo_version, core.get_embedding_dtype(), engine),
+    ) as pool:
+        futures = [pool.submit(_translate_worker_chunk, chunk, mirror_rate, engine) for chunk in chunks]
+        return [row for fut in futures for row in fut.result()]
+
+
+def split_sentences(text: str) -> List[str]:
+    """Sentences of ``text`` exactly as `translate_text` sees them (stripped, non-empty)."""
+    return [p.strip() for p in _SENT_SPLIT.split((text or "").strip()) if p.strip()]
 
 
 def translate_text(
@@ -131,12 +473,146 @@ def translate_text(
     mirror_rate: float = 0.8,
     engine: str = "core",
     W=None,
+    workers: int = 1,
+    chunk_size: int = _PARALLEL_CHUNK_SIZE,
 ) -> List[Dict]:
     """
     Translate multi-sentence text into a list of records.
+
+    Sentences sharing a lemma (or, for sentence-level engines, identical
+    sentences) are translated once per call and the row is reused with its own
+    ``source``; output is the same as translating every sentence separately.
+
+    workers > 1 translates the distinct sentences in chunks of ``chunk_size`` on
+    a process pool whose workers run ``warm_translation_pipeline`` first. Rows
+    come back in document order and equal the serial result; documents with
+    fewer than ``_PARALLEL_MIN_SENTENCES`` distinct sentences run serially.
     """
-    text = (text or "").strip()
-    if not text:
+    parts = split_sentences(text)
+    if not parts:
         return []
-    parts = _SENT_SPLIT.split(text)
-    return [translate_sentence(p, mirror_rate=mirror_rate, engine=engine, W=W) for p in parts if p.strip()]
+    keys = [_document_memo_key(p, engine) for p in parts]
+    first: Dict[Tuple[str, str], int] = {}
+    for i, key in enumerate(keys):
+        first.setdefault(key, i)
+
+    unique = [parts[i] for i in first.values()]
+    chunk_size = max(1, int(chunk_size))
+    if workers and workers > 1 and len(unique) >= _PARALLEL_MIN_SENTENCES and len(unique) > chunk_size:
+        computed = _translate_parallel(unique, mirror_rate, engine, W, workers, chunk_size)
+    else:
+        computed = _translate_chunk(unique, mirror_rate, engine, W)
+
+    memo = dict(zip(first, computed))
+    rows = []
+    for i, (p, key) in enumerate(zip(parts, keys)):
+        row = memo[key]
+        rows.append(row if first[key] == i else _reuse_row(row, p))
+    return rows
+
+
+def _reuse_row(row: Dict, src: str) -> Dict:
+    """A memoized row re-sourced for another sentence, with its own ``anchors`` list."""
+    return dict(row, source=src, anchors=list(row.get("anchors") or []))
+
+
+# -------------------- Streaming --------------------
+_STREAM_CHUNK_CHARS = 1 << 16
+# A "sentence" longer than this without a boundary is emitted as-is so the
+# buffer stays bounded on input that never ends a sentence.
+_STREAM_MAX_SENTENCE_CHARS = 1 << 20
+
+
+def _iter_text_chunks(source, chunk_chars: int) -> Iterator[str]:
+    """Text chunks from a string, a file-like object (text or binary) or an iterable of chunks."""
+    if isinstance(source, (str, bytes)):
+        chunks: Iterable = (source,)
+    elif hasattr(source, "read"):
+        chunks = iter(lambda: source.read(chunk_chars), source.read(0))
+    else:
+        chunks = source
+
+    decoder = None
+    for chunk in chunks:
+        if isinstance(chunk, bytes):
+            decoder = decoder or codecs.getincrementaldecoder("utf-8")()
+            chunk = decoder.decode(chunk)
+        if chunk:
+            yield chunk
+    if decoder is not None:
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+
+def iter_sentences(
+    source: Union[str, bytes, Iterable],
+    *,
+    chunk_chars: int = _STREAM_CHUNK_CHARS,
+    max_sentence_chars: int = _STREAM_MAX_SENTENCE_CHARS,
+) -> Iterator[str]:
+    """
+    Yield the sentences ``translate_text`` would split the whole input into,
+    reading ``source`` incrementally.
+
+    A boundary is only cut once text after its whitespace run has arrived, so
+    runs split across chunks behave as in ``_SENT_SPLIT.split``. Only the
+    unfinished sentence is buffered.
+    """
+    buf = ""
+    scan = 0
+    started = False
+    for chunk in _iter_text_chunks(source, chunk_chars):
+        if not started:
+            chunk = chunk.lstrip()
+            if not chunk:
+                continue
+            started = True
+        buf += chunk
+        start = 0
+        for m in _SENT_SPLIT.finditer(buf, scan):
+            if m.end() == len(buf):
+                break  # the whitespace run may continue in the next chunk
+            if buf[start:m.start()].strip():
+                yield buf[start:m.start()]
+            start = m.end()
+        buf = buf[start:]
+        if len(buf) > max_sentence_chars:
+            if buf.strip():
+                yield buf
+            buf = ""
+        scan = len(buf.rstrip())
+
+    buf = buf.rstrip()
+    if buf.strip():
+        yield buf
+
+
+def translate_iter(
+    source: Union[str, bytes, Iterable],
+    *,
+    mirror_rate: float = 0.8,
+    engine: str = "core",
+    W=None,
+    chunk_chars: int = _STREAM_CHUNK_CHARS,
+    memo_size: int = 65536,
+) -> Iterator[Dict]:
+    """
+    Streaming ``translate_text``: yields one row per sentence as soon as it is read.
+
+    ``source`` may be a string, a file-like object (text or binary, read in
+    ``chunk_chars`` pieces) or an iterable of text chunks such as an open file's
+    lines. Rows equal ``translate_text`` over the concatenated input; the lemma
+    memo is a bounded LRU (``memo_size`` entries), so memory stays bounded.
+    """
+    memo = LRUCache(memo_size)
+    for p in iter_sentences(source, chunk_chars=chunk_chars):
+        src = p.strip()
+        key = _document_memo_key(src, engine)
+        row = memo.get(key)
+        if row is None:
+            row = translate_sentence(p, mirror_rate=mirror_rate, engine=engine, W=W)
+            memo.put(key, _reuse_row(row, src))
+            yield row
+        else:
+            yield _reuse_row(row, src)
@@ -8,9 +8,14 @@ Stores entries in JSON at data/cache/translations.json. Each entry includes:
 - mirror_rate (float)
 - anchors (list)
 - embedding (list[float])
+- embedding_backend (str, e.g. "pseudo-v1"; None if the caller supplied the vector)
 - created_at (iso string)
 
 Cache key is deterministic (engine + mirror_rate + source).
+
+Use `get_cached_translations` / `put_cached_translations` for several rows: the
+missing embeddings are computed with one `embed_texts` call and the JSON file
+is written once per batch instead of once per row.
 """
 
 from __future__ import annotations
@@ -19,12 +24,12 @@ import json
 import os
 import hashlib
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
-from zyntalic.embeddings import embed_text
+from zyntalic.embeddings import embed_texts, embedding_backend
+from zyntalic.utils.paths import ROOT_DIR
 
 # Paths
-ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 CACHE_DIR = os.path.join(ROOT_DIR, "data", "cache")
 CACHE_PATH = os.path.join(CACHE_DIR, "translations.json")
 
@@ -84,6 +89,18 @@ def get_cached_translation(source: str, engine: str, mirror_rate: float) -> Opti
     return dict(entry)
 
 
+def get_cached_translations(
+    sources: Sequence[str], engine: str, mirror_rate: float
+) -> List[Optional[Dict[str, Any]]]:
+    """`get_cached_translation` for each source, in order (None for misses)."""
+    init_cache()
+    out = []
+    for source in sources:
+        entry = _cache.get(_key(source, engine, mirror_rate))
+        out.append(dict(entry) if entry else None)
+    return out
+
+
 def put_cached_translation(
     source: str,
     target: str,
@@ -93,21 +110,45 @@ def put_cached_translation(
     embedding: Optional[List[float]] = None,
 ) -> Dict[str, Any]:
     """Store translation and return the stored entry."""
+    row = {"source": source, "target": target, "engine": engine, "anchors": anchors, "embedding": embedding}
+    return put_cached_translations([row], mirror_rate)[0]
+
+
+def put_cached_translations(
+    rows: Iterable[Dict[str, Any]], mirror_rate: float, engine: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Store several translation rows and return the stored entries, in order.
+
+    Rows are dicts with ``source``, ``target`` and optionally ``engine`` (falls
+    back to ``engine``), ``anchors`` and ``embedding``. Rows without an
+    embedding are embedded together; the cache file is saved once.
+    """
     init_cache()
-    if embedding is None:
-        embedding = embed_text(target or "", dim=300)
-    entry = {
-        "source": source or "",
-        "target": target or "",
-        "engine": engine,
-        "mirror_rate": float(mirror_rate),
-        "anchors": anchors or [],
-        "embedding": embedding,
-        "created_at": datetime.utcnow().isoformat() + "Z",
-    }
-    _cache[_key(source, engine, mirror_rate)] = entry
-    save_cache()
-    return dict(entry)
+    rows = list(rows)
+    missing = [i for i, row in enumerate(rows) if row.get("embedding") is None]
+    vectors = dict(zip(missing, embed_texts([rows[i].get("target") or "" for i in missing], dim=300)))
+    backend = embedding_backend() if missing else None
+    created_at = datetime.utcnow().isoformat() + "Z"
+
+    stored = []
+    for i, row in enumerate(rows):
+        row_engine = row.get("engine") or engine
+        entry = {
+            "source": row.get("source") or "",
+            "target": row.get("target") or "",
+            "engine": row_engine,
+            "mirror_rate": float(mirror_rate),
+            "anchors": row.get("anchors") or [],
+            "embedding": vectors.get(i, row.get("embedding")),
+            "embedding_backend": backend if i in vectors else None,
+            "created_at": created_at,
+        }
+        _cache[_key(row.get("source"), row_engine, mirror_rate)] = entry
+        stored.append(dict(entry))
+    if stored:
+        save_cache()
+    return stored
 
 
 def cache_size() -> int:
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""Content-addressed on-disk store for embedding vectors.
+
+Vectors are keyed by (backend, dim, blake2b(text)). Each (backend, dim) pair
+gets its own directory holding
+
+- ``vectors.f32``: float32 rows of length ``dim``, append-only, read through
+  ``np.memmap`` so lookups never load the whole file;
+- ``index.bin``: 24-byte records, a 16-byte blake2b digest of the text followed
+  by the little-endian uint64 row it points at.
+
+A record is appended only after its row, under a file lock where ``fcntl`` is
+available, so a crash can leave an orphan row but never a record pointing past
+the data. Index records written by other processes are picked up on the next miss.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+try:  # pragma: no cover - POSIX only
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: single-process use only
+    fcntl = None
+
+from .paths import ROOT_DIR, env_path
+
+DEFAULT_STORE_DIR = os.path.join(ROOT_DIR, "data", "cache", "embeddings")
+
+_RECORD = 24
+_DTYPE = np.dtype("<f4")
+
+
+def store_dir() -> Optional[str]:
+    """Store root; ZYNTALIC_EMBEDDING_STORE overrides it and an empty value disables it."""
+    return env_path("ZYNTALIC_EMBEDDING_STORE", DEFAULT_STORE_DIR)
+
+
+def text_key(text: str) -> bytes:
+    return hashlib.blake2b((text or "").encode("utf-8"), digest_size=16).digest()
+
+
+@contextmanager
+def _file_lock(path: str):
+    if fcntl is None:
+        yield
+        return
+    with open(path, "a+b") as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class EmbeddingStore:
+    """Append-only float32 vector store for one (backend, dim)."""
+
+    def __init__(self, root: str, backend: str, dim: int):
+        self.backend = backend
+        self.dim = int(dim)
+        self.directory = os.path.join(root, f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', backend)}-{self.dim}")
+        os.makedirs(self.directory, exist_ok=True)
+        self._vec_path = os.path.join(self.directory, "vectors.f32")
+        self._idx_path = os.path.join(self.directory, "index.bin")
+        self._lock_path = os.path.join(self.directory, ".lock")
+        self._row_bytes = _DTYPE.itemsize * self.dim
+
+        self._lock = threading.Lock()
+        self._index: Dict[bytes, int] = {}
+        self._idx_offset = 0
+        self._mm = None
+        with self._lock:
+            self._refresh()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _refresh(self) -> None:
+        """Read index records appended since the last refresh."""
+        try:
+            with open(self._idx_path, "rb") as f:
+                f.seek(self._idx_offset)
+                data = f.read()
+        except FileNotFoundError:
+            return
+        usable = len(data) - len(data) % _RECORD
+        for off in range(0, usable, _RECORD):
+            self._index[data[off:off + 16]] = int.from_bytes(data[off + 16:off + _RECORD], "little")
+        self._idx_offset += usable
+
+    def _read_rows(self, rows: List[int]):
+        if self._mm is None or max(rows) >= len(self._mm):
+            n = os.path.getsize(self._vec_path) // self._row_bytes
+            self._mm = np.memmap(self._vec_path, dtype=_DTYPE, mode="r", shape=(n, self.dim))
+        return np.array(self._mm[rows], dtype=np.float32)
+
+    def get_many(self, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """Stored vectors for ``texts`` (float32 arrays), None where absent."""
+        keys = [text_key(t) for t in texts]
+        with self._lock:
+            if any(k not in self._index for k in keys):
+                self._refresh()
+            rows = [self._index.get(k) for k in keys]
+            found = [r for r in rows if r is not None]
+            vecs = iter(self._read_rows(found)) if found else iter(())
+        return [None if r is None else next(vecs) for r in rows]
+
+    def put_many(self, texts: Sequence[str], vectors) -> None:
+        """Store ``vectors`` (one row per text); texts already present are skipped."""
+        mat = np.asarray(vectors, dtype=_DTYPE).reshape(len(texts), self.dim)
+        with self._lock, _file_lock(self._lock_path):
+            self._refresh()
+            new: Dict[bytes, int] = {}
+            for i, t in enumerate(texts):
+                k = text_key(t)
+                if k not in self._index and k not in new:
+                    new[k] = i
+            if not new:
+                return
+
+            with open(self._vec_path, "ab") as f:
+                size = f.seek(0, os.SEEK_END)
+                if size % self._row_bytes:  # torn row from an interrupted write
+                    size -= size % self._row_bytes
+                    f.truncate(size)
+                start = size // self._row_bytes
+                f.write(np.ascontiguousarray(mat[list(new.values())]).tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+
+            records = b"".join(k + (start + j).to_bytes(8, "little") for j, k in enumerate(new))
+            with open(self._idx_path, "ab") as f:
+                f.write(records)
+            self._refresh()
+
+
+_STORES: Dict[tuple, EmbeddingStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_store(backend: str, dim: int, root: Optional[str] = None) -> Optional[EmbeddingStore]:
+    """Shared store for (backend, dim) under ``root`` (default: ``store_dir()``); None if disabled."""
+    root = root or store_dir()
+    if not root:
+        return None
+    key = (os.path.abspath(root), backend, int(dim))
+    with _STORES_LOCK:
+        store = _STORES.get(key)
+        if store is None:
+            store = _STORES[key] = EmbeddingStore(root, backend, dim)
+        return store
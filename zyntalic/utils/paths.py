@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+"""Repository root and environment-overridable cache locations."""
+
+from __future__ import annotations
+
+import os
+from typing import Optional
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+
+def env_path(var: str, default: str) -> Optional[str]:
+    """``default`` unless environment variable ``var`` is set; an empty value
+    disables the location (returns None)."""
+    path = os.environ.get(var)
+    if path is None:
+        return default
+    return path or None
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""Longest-match multiword phrase finder (Aho–Corasick over word tokens).
+
+Phrases are compiled once into a word-level automaton; matching a token
+sequence is then one linear pass however many phrases there are.
+
+The automaton is built over the *reversed* phrases and run right to left, so
+the deepest output at each step is the longest phrase *starting* at that
+token. A left-to-right greedy walk over those lengths yields the
+leftmost-longest, non-overlapping segmentation.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+
+def phrase_tokens(phrase: str) -> Tuple[str, ...]:
+    """Normalized token tuple for a phrase (case-folded, whitespace-split)."""
+    return tuple(phrase.casefold().split())
+
+
+class PhraseMatcher:
+    """Compiled set of phrases; see ``find`` and ``segment``."""
+
+    def __init__(self, phrases: Iterable[str]):
+        # node 0 is the root; per node: children, failure link, longest phrase ending here
+        self._goto: List[Dict[str, int]] = [{}]
+        self._depth: List[int] = [0]
+        self._fail: List[int] = [0]
+        self._best: List[int] = [0]
+        self.phrases = set()
+
+        for phrase in phrases:
+            tokens = phrase_tokens(phrase)
+            if not tokens or tokens in self.phrases:
+                continue
+            self.phrases.add(tokens)
+            node = 0
+            for tok in reversed(tokens):
+                nxt = self._goto[node].get(tok)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][tok] = nxt
+                    self._goto.append({})
+                    self._depth.append(self._depth[node] + 1)
+                    self._fail.append(0)
+                    self._best.append(0)
+                node = nxt
+            self._best[node] = len(tokens)
+        self._link()
+
+    def __len__(self) -> int:
+        return len(self.phrases)
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            # a terminal node's own phrase is longer than anything on its failure chain
+            if not self._best[node]:
+                self._best[node] = self._best[self._fail[node]]
+            for tok, child in self._goto[node].items():
+                f = self._fail[node]
+                while f and tok not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(tok, 0)
+                self._fail[child] = target if target != child else 0
+                queue.append(child)
+
+    def longest_at(self, tokens: Sequence[str]) -> List[int]:
+        """Length of the longest phrase starting at each position (0 where none does)."""
+        goto, fail, best = self._goto, self._fail, self._best
+        out = [0] * len(tokens)
+        node = 0
+        for i in range(len(tokens) - 1, -1, -1):
+            tok = tokens[i].casefold()
+            while node and tok not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(tok, 0)
+            out[i] = best[node]
+        return out
+
+    def find(self, tokens: Sequence[str]) -> List[Tuple[int, int]]:
+        """Leftmost-longest non-overlapping ``(start, end)`` spans of known phrases."""
+        lengths = self.longest_at(tokens)
+        spans = []
+        i = 0
+        while i < len(tokens):
+            if lengths[i]:
+                spans.append((i, i + lengths[i]))
+                i += lengths[i]
+            else:
+                i += 1
+        return spans
+
+    def segment(self, tokens: Sequence[str]) -> List[Tuple[Tuple[str, ...], bool]]:
+        """Cover ``tokens`` in order: each known phrase as one ``(tokens, True)``
+        chunk, every other token as ``((token,), False)``."""
+        out = []
+        pos = 0
+        for start, end in self.find(tokens):
+            out.extend(((t,), False) for t in tokens[pos:start])
+            out.append((tuple(tokens[start:end]), True))
+            pos = end
+        out.extend(((t,), False) for t in tokens[pos:])
+        return out
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""Thread-safe build-once registry for process-wide resources.
+
+``zyntalic.core`` keeps its lexicons, mappings and anchor sets here, and
+``zyntalic.translator`` its engine instances.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Callable, Dict, List, Optional
+
+
+class ResourceRegistry:
+    """Process-wide resources keyed by (name, *params), each built exactly once.
+
+    Reads of an already-built key are a plain dict lookup. A miss takes a per-key
+    lock, so concurrent first requests (FastAPI runs sync endpoints in a
+    threadpool) wait for a single load instead of each repeating it, while
+    unrelated keys still load in parallel.
+    """
+
+    def __init__(self):
+        self._values: Dict[tuple, object] = {}
+        self._locks: Dict[tuple, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def get(self, key: tuple, factory: Callable[[], object]):
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        with self._guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            if key not in self._values:
+                self._values[key] = factory()
+            return self._values[key]
+
+    def clear(self, name: Optional[str] = None) -> None:
+        """Forget every resource, or only those whose key starts with ``name``."""
+        with self._guard:
+            for key in [k for k in self._values if name is None or k[0] == name]:
+                del self._values[key]
+
+    def keys(self) -> List[tuple]:
+        return list(self._values)
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""Compiled resource snapshot with freshness checks.
+
+A snapshot is one pickle holding several named sections. Each section records
+the source files it was compiled from (path, size, mtime_ns) plus a sha256 over
+their contents. A section is used only while it is fresh:
+
+1. same file list and same size/mtime for every file -> fresh (stat only), or
+2. contents still hash to the recorded digest (e.g. after a checkout touched
+   mtimes) -> fresh.
+
+Anything else is stale and callers fall back to parsing the sources.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import sys
+from typing import Any, Dict, List, Optional, Sequence
+
+from .paths import ROOT_DIR, env_path
+
+SNAPSHOT_FORMAT = "zyntalic-snapshot"
+SNAPSHOT_VERSION = 1
+
+DEFAULT_SNAPSHOT_PATH = os.path.join(ROOT_DIR, "data", "cache", "resources_snapshot.pkl")
+
+# path -> (mtime_ns, size, snapshot dict); avoids unpickling once per section
+_LOADED: Dict[str, tuple] = {}
+
+
+def snapshot_path() -> Optional[str]:
+    """Snapshot location; ZYNTALIC_SNAPSHOT overrides it and an empty value disables it."""
+    return env_path("ZYNTALIC_SNAPSHOT", DEFAULT_SNAPSHOT_PATH)
+
+
+def _stat_files(paths: Sequence[str]) -> List[List[Any]]:
+    out = []
+    for p in paths:
+        st = os.stat(p)
+        out.append([os.path.abspath(p), st.st_size, st.st_mtime_ns])
+    return out
+
+
+def _hash_files(paths: Sequence[str]) -> str:
+    h = hashlib.sha256()
+    for p in paths:
+        h.update(os.path.basename(p).encode("utf-8") + b"\0")
+        with open(p, "rb") as f:
+            h.update(f.read())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def make_section(source: str, paths: Sequence[str], data: Any) -> Dict[str, Any]:
+    paths = sorted(paths)
+    return {"source": source, "files": _stat_files(paths), "sha256": _hash_files(paths), "data": data}
+
+
+def write_snapshot(sections: Dict[str, Dict[str, Any]], path: Optional[str] = None) -> str:
+    """Write sections (built with ``make_section``) atomically; returns the path."""
+    path = path or snapshot_path() or DEFAULT_SNAPSHOT_PATH
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    payload = {
+        "format": SNAPSHOT_FORMAT,
+        "version": SNAPSHOT_VERSION,
+        "python": list(sys.version_info[:2]),
+        "sections": sections,
+    }
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    _LOADED.pop(path, None)
+    return path
+
+
+def _read_snapshot(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    hit = _LOADED.get(path)
+    if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return hit[2]
+    try:
+        with open(path, "rb") as f:
+            payload = pickle.load(f)
+    except Exception:
+        return None
+    if (
+        not isinstance(payload, dict)
+        or payload.get("format") != SNAPSHOT_FORMAT
+        or payload.get("version") != SNAPSHOT_VERSION
+        or payload.get("python") != list(sys.version_info[:2])
+    ):
+        return None
+    _LOADED[path] = (st.st_mtime_ns, st.st_size, payload)
+    return payload
+
+
+def read_section(name: str, source: str, paths: Sequence[str], path: Optional[str] = None) -> Optional[Any]:
+    """Return the data of section ``name`` if it is fresh for ``paths``, else None."""
+    path = path or snapshot_path()
+    if not path:
+        return None
+    payload = _read_snapshot(path)
+    if payload is None:
+        return None
+    section = payload["sections"].get(name)
+    if section is None or section.get("source") != source:
+        return None
+
+    paths = sorted(paths)
+    try:
+        current = _stat_files(paths)
+        recorded = section["files"]
+        if [c[0] for c in current] != [r[0] for r in recorded]:
+            return None
+        if current == recorded or _hash_files(paths) == section["sha256"]:
+            return section["data"]
+    except OSError:
+        return None
+    return None